@@ -1,10 +1,18 @@
 """Context management for optimizing Claude's token window."""
 
-from typing import List, Dict, Any, Optional
+import heapq
+import re
+from bisect import bisect_right
+from itertools import accumulate
+from operator import attrgetter
+from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 
+# Appended to content cut short by _truncate_to_tokens
+_TRUNCATION_MARKER = "\n\n[... truncated ...]"
 
-@dataclass
+
+@dataclass(slots=True)
 class ContextComponent:
     """A component to include in context."""
     content: str
@@ -56,36 +64,31 @@ class ContextManager:
                 optional.append(component)
 
         # Sort optional by priority (highest first)
-        optional.sort(key=lambda x: x.priority, reverse=True)
+        optional.sort(key=attrgetter('priority'), reverse=True)
 
         # Build context starting with required
         context_parts = []
         total_tokens = 0
 
-        # Add required components
-        for component in required:
-            if total_tokens + component.token_estimate > self.max_tokens:
-                # Truncate if necessary
-                remaining_tokens = self.max_tokens - total_tokens
-                truncated = self._truncate_to_tokens(component.content, remaining_tokens)
-                context_parts.append(truncated)
-                break
-            else:
-                context_parts.append(component.content)
-                total_tokens += component.token_estimate
+        # Add required components; the first that does not fit is truncated
+        count, used = self._fit_prefix(required, self.max_tokens)
+        context_parts.extend(component.content for component in required[:count])
+        total_tokens += used
+        if count < len(required):
+            remaining_tokens = self.max_tokens - total_tokens
+            truncated = self._truncate_to_tokens(required[count].content, remaining_tokens)
+            context_parts.append(truncated)
 
         # Add optional components by priority
-        for component in optional:
-            if total_tokens + component.token_estimate > self.max_tokens:
-                # Try to fit a truncated version
-                remaining_tokens = self.max_tokens - total_tokens
-                if remaining_tokens > 1000:  # Only if we have meaningful space
-                    truncated = self._truncate_to_tokens(component.content, remaining_tokens)
-                    context_parts.append(truncated)
-                break
-            else:
-                context_parts.append(component.content)
-                total_tokens += component.token_estimate
+        count, used = self._fit_prefix(optional, self.max_tokens - total_tokens)
+        context_parts.extend(component.content for component in optional[:count])
+        total_tokens += used
+        if count < len(optional):
+            # Try to fit a truncated version
+            remaining_tokens = self.max_tokens - total_tokens
+            if remaining_tokens > 1000:  # Only if we have meaningful space
+                truncated = self._truncate_to_tokens(optional[count].content, remaining_tokens)
+                context_parts.append(truncated)
 
         return "\n\n---\n\n".join(context_parts)
 
@@ -111,6 +114,13 @@ class ContextManager:
             return sources[:max_sources]
 
         query_terms = set(query.lower().split())
+        if not query_terms:
+            return sources[:max_sources]
+
+        # Compile the terms once: whole words for title/abstract, substrings for keywords
+        alternation = '|'.join(map(re.escape, sorted(query_terms, key=len, reverse=True)))
+        word_pattern = re.compile(rf'(?<!\S)(?:{alternation})(?!\S)', re.IGNORECASE)
+        term_pattern = re.compile(alternation, re.IGNORECASE)
 
         # Score each source
         scored_sources = []
@@ -120,26 +130,28 @@ class ContextManager:
             # Check title
             title = source.get('metadata', {}).get('title', '')
             if title:
-                title_terms = set(title.lower().split())
-                score += len(query_terms & title_terms) * 3
+                title_matches = {match.lower() for match in word_pattern.findall(title)}
+                score += len(title_matches) * 3
+
+            content = source.get('content', {})
 
             # Check abstract
-            abstract = source.get('content', {}).get('abstract', '')
+            abstract = content.get('abstract', '')
             if abstract:
-                abstract_terms = set(abstract.lower().split())
-                score += len(query_terms & abstract_terms) * 2
+                abstract_matches = {match.lower() for match in word_pattern.findall(abstract)}
+                score += len(abstract_matches) * 2
 
             # Check keywords
-            keywords = source.get('content', {}).get('keywords', [])
+            keywords = content.get('keywords', [])
             for keyword in keywords:
-                if any(term in keyword.lower() for term in query_terms):
+                if term_pattern.search(keyword):
                     score += 2
 
             scored_sources.append((score, source))
 
-        # Sort by score and return top sources
-        scored_sources.sort(key=lambda x: x[0], reverse=True)
-        return [source for score, source in scored_sources[:max_sources]]
+        # Select the top sources by score (ties keep their input order)
+        top_sources = heapq.nlargest(max_sources, scored_sources, key=lambda x: x[0])
+        return [source for score, source in top_sources]
 
     def chunk_large_content(
         self,
@@ -163,22 +175,30 @@ class ContextManager:
             return [content]
 
         chunks = []
-        start = 0
+        current: List[str] = []
+        current_size = 0  # length of the paragraphs in current once joined
+
+        for paragraph in content.split('\n\n'):
+            # A paragraph longer than a whole chunk is cut at the size limit
+            while len(paragraph) > char_size:
+                if current:
+                    chunks.append('\n\n'.join(current))
+                    current, current_size = [], 0
+                chunks.append(paragraph[:char_size])
+                paragraph = paragraph[char_size:]
 
-        while start < len(content):
-            end = start + char_size
+            # Start a new chunk at this paragraph boundary if it would overflow
+            if current and current_size + 2 + len(paragraph) > char_size:
+                chunks.append('\n\n'.join(current))
+                current, current_size = [], 0
 
-            # Try to break at paragraph boundary
-            if end < len(content):
-                # Look for paragraph break
-                paragraph_break = content.rfind('\n\n', start, end)
-                if paragraph_break > start:
-                    end = paragraph_break
+            current_size += len(paragraph) + 2 if current else len(paragraph)
+            current.append(paragraph)
 
-            chunks.append(content[start:end].strip())
-            start = end
+        if current:
+            chunks.append('\n\n'.join(current))
 
-        return chunks
+        return [stripped for chunk in chunks if (stripped := chunk.strip())]
 
     def summarize_for_context(
         self,
@@ -204,6 +224,26 @@ class ContextManager:
         half = max_length // 2
         return f"{content[:half]}\n\n[... content truncated ...]\n\n{content[-half:]}"
 
+    def _fit_prefix(
+        self,
+        components: List[ContextComponent],
+        budget: int
+    ) -> Tuple[int, int]:
+        """
+        Find how many leading components fit within a token budget.
+
+        Args:
+            components: Components in inclusion order
+            budget: Tokens available
+
+        Returns:
+            Number of components that fit and the tokens they use
+        """
+        # Running totals are non-decreasing, so the cutoff is a binary search
+        totals = list(accumulate(map(attrgetter('token_estimate'), components)))
+        count = bisect_right(totals, budget)
+        return count, totals[count - 1] if count else 0
+
     def _estimate_tokens(self, text: str) -> int:
         """Estimate token count for text."""
         # Simple estimation: ~4 characters per token
@@ -215,4 +255,7 @@ class ContextManager:
         if len(text) <= max_chars:
             return text
 
-        return text[:max_chars] + "\n\n[... truncated ...]"
+        # The marker counts towards the budget; below its length a plain cut is all that fits
+        if max_chars < len(_TRUNCATION_MARKER):
+            return text[:max_chars]
+        return text[:max_chars - len(_TRUNCATION_MARKER)] + _TRUNCATION_MARKER
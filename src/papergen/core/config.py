@@ -1,36 +1,85 @@
 """Configuration management for PaperGen."""
 
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 import os
+import sys
 
 import yaml
 from dotenv import load_dotenv
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
+# Settings returned by Config.get_api_config and their defaults
+_API_DEFAULTS = {
+    'provider': 'anthropic',
+    'model': 'claude-opus-4-5',
+    'max_tokens': 4096,
+    'temperature': 0.7,
+    'timeout': 120,
+}
+
+
+def _intern_keys(tree: Dict[Any, Any]) -> Dict[Any, Any]:
+    """Copy a nested config dict with every string key interned."""
+    return {
+        sys.intern(key) if isinstance(key, str) else key:
+            _intern_keys(value) if isinstance(value, dict) else value
+        for key, value in tree.items()
+    }
+
 
 class Config:
     """Configuration manager for PaperGen."""
 
     _instance: Optional['Config'] = None
-    _config: Dict[str, Any] = {}
+    _data: Dict[str, Any] = {}
+    _loaded: bool = False
 
     def __new__(cls):
-        """Singleton pattern for configuration."""
+        """Singleton pattern for configuration; YAML files are read on first use."""
         if cls._instance is None:
             cls._instance = super().__new__(cls)
-            cls._instance._load_config()
+            cls._instance._data = {}
+            # Code that reads os.environ directly relies on .env being applied at import
+            load_dotenv()
         return cls._instance
 
-    def _load_config(self) -> None:
-        """Load configuration from files and environment."""
-        # Load environment variables
-        load_dotenv()
+    def _ensure_loaded(self) -> None:
+        """Load configuration files the first time a value is needed."""
+        if not self._loaded:
+            self._loaded = True
+            self._load_config()
 
+    def _load_config(self) -> None:
+        """Load configuration from files."""
         # Load default config
         default_config_path = Path(__file__).parent.parent.parent.parent / "config" / "default_config.yaml"
         if default_config_path.exists():
             with open(default_config_path, 'r') as f:
-                self._config = yaml.safe_load(f) or {}
+                self._config = _intern_keys(yaml.load(f, Loader=_YamlLoader) or {})
+
+    @property
+    def _config(self) -> Dict[str, Any]:
+        """Nested configuration tree."""
+        self._ensure_loaded()
+        return self._data
+
+    @_config.setter
+    def _config(self, value: Dict[str, Any]) -> None:
+        # Assigning a whole tree counts as loading it
+        self._loaded = True
+        self._data = value
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _split_key(key: str) -> Tuple[str, ...]:
+        """Split a dotted key into interned path components (cached per key)."""
+        return tuple(sys.intern(part) for part in key.split('.'))
 
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -43,18 +92,21 @@ class Config:
         Returns:
             Configuration value
         """
-        keys = key.split('.')
-        value = self._config
-
-        for k in keys:
-            if isinstance(value, dict):
-                value = value.get(k)
-                if value is None:
-                    return default
-            else:
+        if '.' not in key:
+            value = self._config.get(key)
+            return default if value is None else value
+
+        node = self._config
+
+        # One dict lookup per level; a stored None counts as missing
+        for part in self._split_key(key):
+            if not isinstance(node, dict):
+                return default
+            node = node.get(part)
+            if node is None:
                 return default
 
-        return value
+        return node
 
     def set(self, key: str, value: Any) -> None:
         """
@@ -64,13 +116,19 @@ class Config:
             key: Configuration key (supports dot notation)
             value: Value to set
         """
-        keys = key.split('.')
+        if '.' not in key:
+            self._config[key] = value
+            return
+
+        keys = self._split_key(key)
         config = self._config
 
+        # One lookup per level; a scalar in the way is replaced by a new section
         for k in keys[:-1]:
-            if k not in config:
-                config[k] = {}
-            config = config[k]
+            node = config.setdefault(k, {})
+            if not isinstance(node, dict):
+                node = config[k] = {}
+            config = node
 
         config[keys[-1]] = value
 
@@ -114,16 +172,18 @@ class Config:
 
     def get_api_config(self) -> Dict[str, Any]:
         """Get API configuration."""
+        # One lookup for the api section instead of a dotted walk per setting
+        api = self._config.get('api')
+        if not isinstance(api, dict):
+            api = {}
+
         config = {
-            'provider': self.get('api.provider', 'anthropic'),
-            'model': self.get('api.model', 'claude-opus-4-5'),
-            'max_tokens': self.get('api.max_tokens', 4096),
-            'temperature': self.get('api.temperature', 0.7),
-            'timeout': self.get('api.timeout', 120),
+            name: default if (value := api.get(name)) is None else value
+            for name, default in _API_DEFAULTS.items()
         }
 
         # Add base_url if configured (for self-hosted or third-party APIs)
-        base_url = self.get_api_base_url()
+        base_url = os.getenv('ANTHROPIC_BASE_URL') or api.get('base_url')
         if base_url:
             config['base_url'] = base_url
 
@@ -154,15 +214,17 @@ class Config:
         config_file = project_path / ".papergen" / "config.yaml"
         if config_file.exists():
             with open(config_file, 'r') as f:
-                project_config = yaml.safe_load(f) or {}
+                project_config = _intern_keys(yaml.load(f, Loader=_YamlLoader) or {})
                 # Merge with existing config (project config takes precedence)
                 self._merge_config(self._config, project_config)
 
     def _merge_config(self, base: Dict, override: Dict) -> None:
         """Recursively merge configuration dictionaries."""
+        # YAML and _intern_keys only produce plain dicts, so exact type checks suffice
         for key, value in override.items():
-            if key in base and isinstance(base[key], dict) and isinstance(value, dict):
-                self._merge_config(base[key], value)
+            existing = base.get(key)
+            if type(existing) is dict and type(value) is dict:
+                self._merge_config(existing, value)
             else:
                 base[key] = value
 
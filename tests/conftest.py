@@ -6,10 +6,15 @@ import tempfile
 import shutil
 from datetime import datetime
 import json
+from types import SimpleNamespace as NS
+from unittest.mock import Mock
+
+from typer.testing import CliRunner
 
 from papergen.core.project import PaperProject
 from papergen.core.state import ProjectState, ProjectMetadata
 from papergen.core.config import Config
+from papergen.interactive.tools.file_tools import ReadFileTool, WriteFileTool, SearchFilesTool
 
 
 @pytest.fixture
@@ -261,6 +266,64 @@ def sample_outline():
     }
 
 
+@pytest.fixture(scope="session", autouse=True)
+def _preimport_patch_targets():
+    """Import lazily loaded modules that tests patch by dotted path, once per session."""
+    import papergen.ai.claude_client  # noqa: F401
+
+
+@pytest.fixture(scope="session")
+def runner():
+    """CLI runner shared across the session."""
+    return CliRunner()
+
+
+@pytest.fixture(scope="session")
+def read_file_tool():
+    """ReadFileTool shared across the session; file tools keep no state between calls."""
+    return ReadFileTool()
+
+
+@pytest.fixture(scope="session")
+def write_file_tool():
+    """WriteFileTool shared across the session."""
+    return WriteFileTool()
+
+
+@pytest.fixture(scope="session")
+def search_files_tool():
+    """SearchFilesTool shared across the session."""
+    return SearchFilesTool()
+
+
+@pytest.fixture
+def make_mock_project():
+    """Factory for PaperProject-specced Mock projects.
+
+    Every call builds a new project, so tests may freely rebind its attributes.
+    Passing ``root`` points every directory getter at it.
+    """
+    def make(template="ieee", title="Test Paper", authors=(), keywords=(), topic="Test Topic",
+             root=None):
+        project = Mock(spec=PaperProject)
+        project.root_path = Path("/tmp/test")
+        project.state = Mock(spec=ProjectState)
+        project.state.template = template
+        project.state.metadata = NS(title=title, authors=list(authors), keywords=list(keywords))
+        project.state.topic = topic
+        if root is None:
+            project.get_outline_dir.return_value = Path("/tmp/test/outline")
+            project.get_research_dir.return_value = Path("/tmp/test/research")
+            project.get_output_dir.return_value = Path("/tmp/test/output")
+        else:
+            project.get_outline_dir.return_value = root
+            project.get_research_dir.return_value = root
+            project.get_output_dir.return_value = root
+        return project
+
+    return make
+
+
 # Pytest configuration
 def pytest_configure(config):
     """Configure pytest with custom markers."""
@@ -1,81 +1,101 @@
 """Tests for discover CLI commands."""
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock
-from pathlib import Path
-import tempfile
-import json
-
-from typer.testing import CliRunner
+from unittest.mock import Mock
+from types import SimpleNamespace
 
 from papergen.cli.discover import (
-    app, _display_survey_results, _display_paper_analysis,
+    app, analyze_survey, analyze_paper, brainstorm_ideas, _display_survey_results, _display_paper_analysis,
     _display_ideas, _display_multi_llm_results, _save_reports
 )
+from papergen.discovery.brainstorm import IdeaGenerator
+from papergen.discovery.papers import PaperFinder
+from papergen.discovery.survey import SurveyAnalyzer
+from papergen.sources.pdf_extractor import PDFExtractor
+
 
+_CONTEXT_JSON = (
+    b'{"research_gaps": [{"gap": "Gap 1"}], "weaknesses": ["Weakness 1"], '
+    b'"future_directions": [{"direction": "Dir 1"}]}'
+)
 
-runner = CliRunner()
+# Display helpers only read their input, so these payloads are shared
+_SURVEY_RESULTS = {
+    "research_gaps": [{"gap": "Gap 1"}, "Gap 2"],
+    "key_papers_to_read": [{"title": "Paper 1"}, "Paper 2"],
+    "future_directions": [{"direction": "Dir 1"}, "Dir 2"]
+}
+
+_PAPER_ANALYSIS = {
+    "title": "Test Paper",
+    "core_contribution": "Test contribution",
+    "strengths": ["Strength 1"],
+    "weaknesses": ["Weakness 1"],
+    "inspiration_for_new_research": [{"idea": "Idea 1"}]
+}
+
+_IDEAS = [
+    {
+        "title": "Idea 1",
+        "one_sentence": "Brief description",
+        "novelty": "High",
+        "feasibility": "Medium",
+        "potential_venues": ["NeurIPS", "ICML"],
+        "first_steps": ["Step 1", "Step 2"]
+    }
+]
+
+
+@pytest.mark.parametrize("command", ["survey", "paper", "brainstorm"])
+def test_command_help(runner, command):
+    """Test --help renders for each discover command."""
+    result = runner.invoke(app, [command, "--help"])
+
+    assert result.exit_code == 0
+    assert command in result.output.lower()
 
 
 class TestSurveyCommand:
     """Tests for survey command."""
 
-    def test_survey_help(self):
-        """Test survey command help."""
-        result = runner.invoke(app, ["survey", "--help"])
-        assert result.exit_code == 0
-        assert "survey" in result.output.lower()
-
-    def test_survey_nonexistent_pdf(self):
+    def test_survey_nonexistent_pdf(self, runner):
         """Test survey with nonexistent PDF."""
         result = runner.invoke(app, ["survey", "/nonexistent/file.pdf", "--topic", "AI"])
         # Should fail or show error
-        assert result.exit_code != 0 or "error" in result.output.lower()
+        assert result.exit_code != 0 or b"error" in result.stdout_bytes.lower()
 
-    def test_survey_with_output(self):
+    def test_survey_with_output(self, monkeypatch, tmp_path):
         """Test survey with output file."""
-        mock_extractor = Mock()
+        mock_extractor = Mock(spec_set=PDFExtractor)
         mock_extractor.extract.return_value = {"full_text": "Survey content"}
 
-        mock_analyzer = Mock()
+        mock_analyzer = Mock(spec_set=SurveyAnalyzer)
         mock_analyzer.analyze_survey.return_value = {
             "research_gaps": [{"gap": "Test gap"}],
             "key_papers_to_read": [{"title": "Paper 1"}],
             "future_directions": [{"direction": "Direction 1"}]
         }
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            pdf_file = Path(tmpdir) / "survey.pdf"
-            pdf_file.write_text("fake pdf")
-            output_file = Path(tmpdir) / "results.json"
+        pdf_file = tmp_path / "survey.pdf"
+        output_file = tmp_path / "results.json"
 
-            with patch('papergen.sources.pdf_extractor.PDFExtractor', return_value=mock_extractor):
-                with patch('papergen.discovery.survey.SurveyAnalyzer', return_value=mock_analyzer):
-                    result = runner.invoke(app, [
-                        "survey", str(pdf_file),
-                        "--topic", "Machine Learning",
-                        "--output", str(output_file)
-                    ])
+        monkeypatch.setattr('papergen.sources.pdf_extractor.PDFExtractor', lambda *a, **k: mock_extractor)
+        monkeypatch.setattr('papergen.discovery.survey.SurveyAnalyzer', lambda *a, **k: mock_analyzer)
+        analyze_survey(pdf_path=pdf_file, topic="Machine Learning", output=output_file)
 
-                    # Check if analysis was attempted (may fail on dependencies)
-                    assert result.exit_code == 0 or "error" in result.output.lower()
+        mock_analyzer.analyze_survey.assert_called_once_with("Survey content", "Machine Learning")
+        assert output_file.exists()
 
 
 class TestPaperCommand:
     """Tests for paper command."""
 
-    def test_paper_help(self):
-        """Test paper command help."""
-        result = runner.invoke(app, ["paper", "--help"])
-        assert result.exit_code == 0
-        assert "paper" in result.output.lower()
-
-    def test_paper_analysis(self):
+    def test_paper_analysis(self, monkeypatch, tmp_path):
         """Test paper analysis."""
-        mock_extractor = Mock()
+        mock_extractor = Mock(spec_set=PDFExtractor)
         mock_extractor.extract.return_value = {"full_text": "Paper content"}
 
-        mock_finder = Mock()
+        mock_finder = Mock(spec_set=PaperFinder)
         mock_finder.analyze_paper.return_value = {
             "title": "Test Paper",
             "core_contribution": "Test contribution",
@@ -84,352 +104,115 @@ class TestPaperCommand:
             "inspiration_for_new_research": [{"idea": "Research idea"}]
         }
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            pdf_file = Path(tmpdir) / "paper.pdf"
-            pdf_file.write_text("fake pdf")
+        pdf_file = tmp_path / "paper.pdf"
 
-            with patch('papergen.sources.pdf_extractor.PDFExtractor', return_value=mock_extractor):
-                with patch('papergen.discovery.papers.PaperFinder', return_value=mock_finder):
-                    result = runner.invoke(app, ["paper", str(pdf_file)])
+        monkeypatch.setattr('papergen.sources.pdf_extractor.PDFExtractor', lambda *a, **k: mock_extractor)
+        monkeypatch.setattr('papergen.discovery.papers.PaperFinder', lambda *a, **k: mock_finder)
+        analyze_paper(pdf_path=pdf_file, title=None)
 
-                    # Should complete or show error (may fail on dependencies)
-                    assert result.exit_code == 0 or "error" in result.output.lower()
+        mock_finder.analyze_paper.assert_called_once_with("Paper content", "paper")
 
 
 class TestBrainstormCommand:
     """Tests for brainstorm command."""
 
-    def test_brainstorm_help(self):
-        """Test brainstorm command help."""
-        result = runner.invoke(app, ["brainstorm", "--help"])
-        assert result.exit_code == 0
-        assert "brainstorm" in result.output.lower()
-
-    def test_brainstorm_single_llm(self):
+    def test_brainstorm_single_llm(self, monkeypatch):
         """Test brainstorm with single LLM."""
-        mock_generator = Mock()
+        mock_generator = Mock(spec_set=IdeaGenerator)
         mock_generator.generate_ideas.return_value = [
             {"title": "Idea 1", "novelty": "High"}
         ]
 
-        with patch('papergen.discovery.brainstorm.IdeaGenerator', return_value=mock_generator):
-            result = runner.invoke(app, ["brainstorm", "Machine Learning"])
+        monkeypatch.setattr('papergen.discovery.brainstorm.IdeaGenerator', lambda *a, **k: mock_generator)
+        brainstorm_ideas(
+            topic="Machine Learning", num_ideas=5, context_file=None,
+            multi_llm=False, output=None
+        )
 
-            # Should attempt generation (may fail on API init)
-            assert result.exit_code == 0 or "error" in result.output.lower()
+        mock_generator.generate_ideas.assert_called_once_with(5)
 
-    def test_brainstorm_with_context_file(self):
+    def test_brainstorm_with_context_file(self, monkeypatch, tmp_path):
         """Test brainstorm with context file."""
-        mock_generator = Mock()
+        mock_generator = Mock(spec_set=IdeaGenerator)
         mock_generator.generate_ideas.return_value = []
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            context_file = Path(tmpdir) / "context.json"
-            context_file.write_text(json.dumps({
-                "research_gaps": [{"gap": "Gap 1"}],
-                "weaknesses": ["Weakness 1"],
-                "future_directions": [{"direction": "Dir 1"}]
-            }))
+        context_file = tmp_path / "context.json"
+        context_file.write_bytes(_CONTEXT_JSON)
 
-            with patch('papergen.discovery.brainstorm.IdeaGenerator', return_value=mock_generator):
-                result = runner.invoke(app, [
-                    "brainstorm", "AI",
-                    "--context", str(context_file)
-                ])
+        monkeypatch.setattr('papergen.discovery.brainstorm.IdeaGenerator', lambda *a, **k: mock_generator)
+        brainstorm_ideas(
+            topic="AI", num_ideas=5, context_file=context_file,
+            multi_llm=False, output=None
+        )
 
-                # Should attempt to load context
-                assert result.exit_code == 0 or "error" in result.output.lower()
+        # Should load context from the file
+        mock_generator.set_context.assert_called_once_with(
+            topic="AI",
+            research_gaps=[{"gap": "Gap 1"}],
+            paper_weaknesses=["Weakness 1"],
+            future_directions=[{"direction": "Dir 1"}]
+        )
 
-    def test_brainstorm_multi_llm(self):
+    def test_brainstorm_multi_llm(self, runner, monkeypatch):
         """Test brainstorm with multi-LLM mode."""
-        mock_generator = Mock()
+        mock_generator = Mock(spec_set=IdeaGenerator)
         mock_generator.generate_ideas.return_value = []
         mock_generator.get_summary.return_value = {"summary": "Test summary"}
         mock_generator.get_reports.return_value = []
 
-        with patch('papergen.discovery.brainstorm.IdeaGenerator', return_value=mock_generator):
-            result = runner.invoke(app, ["brainstorm", "AI", "--multi"])
-
-            # Should attempt multi-LLM mode
-            assert result.exit_code == 0 or "error" in result.output.lower()
-
-
-class TestSearchCommand:
-    """Tests for search command."""
-
-    def test_search_help(self):
-        """Test search command help."""
-        result = runner.invoke(app, ["search", "--help"])
-        assert result.exit_code == 0
-        assert "search" in result.output.lower()
-
-    def test_search_papers(self):
-        """Test searching for papers."""
-        mock_paper = Mock()
-        mock_paper.title = "Test Paper"
-        mock_paper.year = 2024
-        mock_paper.citation_count = 100
-        mock_paper.venue = "NeurIPS"
-        mock_paper.to_dict.return_value = {"title": "Test Paper"}
-
-        mock_client = Mock()
-        mock_client.search_papers.return_value = [mock_paper]
-
-        with patch('papergen.sources.semantic_scholar.SemanticScholarClient', return_value=mock_client):
-            result = runner.invoke(app, ["search", "machine learning"])
-
-            # Should attempt to search
-            assert result.exit_code == 0 or mock_client.search_papers.called
-
-    def test_search_no_results(self):
-        """Test search with no results."""
-        mock_client = Mock()
-        mock_client.search_papers.return_value = []
-
-        with patch('papergen.sources.semantic_scholar.SemanticScholarClient', return_value=mock_client):
-            result = runner.invoke(app, ["search", "xyznonexistent"])
-
-            assert "no papers" in result.output.lower() or result.exit_code == 0
-
-    def test_search_with_filters(self):
-        """Test search with filters."""
-        mock_client = Mock()
-        mock_client.search_papers.return_value = []
-
-        with patch('papergen.sources.semantic_scholar.SemanticScholarClient', return_value=mock_client):
-            result = runner.invoke(app, [
-                "search", "AI",
-                "--limit", "5",
-                "--year", "2023",
-                "--min-citations", "50"
-            ])
-
-            # Should attempt search with filters
-            assert result.exit_code == 0 or mock_client.search_papers.called
-
-
-class TestCitationsCommand:
-    """Tests for citations command."""
-
-    def test_citations_help(self):
-        """Test citations command help."""
-        result = runner.invoke(app, ["citations", "--help"])
-        assert result.exit_code == 0
-        assert "citation" in result.output.lower()
-
-    def test_citations_paper_not_found(self):
-        """Test citations when paper not found."""
-        mock_client = Mock()
-        mock_client.analyze_citation_graph.return_value = None
-
-        with patch('papergen.sources.semantic_scholar.SemanticScholarClient', return_value=mock_client):
-            result = runner.invoke(app, ["citations", "nonexistent-paper-id"])
-
-            assert "not found" in result.output.lower() or result.exit_code == 0
-
-    def test_citations_success(self):
-        """Test successful citation analysis."""
-        mock_client = Mock()
-        mock_client.analyze_citation_graph.return_value = {
-            'paper': {
-                'title': 'Test Paper',
-                'year': 2024,
-                'citation_count': 100,
-                'reference_count': 50,
-                'influential_citation_count': 10
-            },
-            'citation_velocity': 25.5,
-            'top_citing_papers': [
-                {'title': 'Citing Paper 1', 'year': 2024, 'citation_count': 50}
-            ],
-            'top_referenced_papers': [
-                {'title': 'Reference 1', 'year': 2020, 'citation_count': 200}
-            ]
-        }
-
-        with patch('papergen.sources.semantic_scholar.SemanticScholarClient', return_value=mock_client):
-            result = runner.invoke(app, ["citations", "test-paper-id"])
-
-            assert result.exit_code == 0 or mock_client.analyze_citation_graph.called
-
-
-class TestRecommendCommand:
-    """Tests for recommend command."""
-
-    def test_recommend_help(self):
-        """Test recommend command help."""
-        result = runner.invoke(app, ["recommend", "--help"])
-        assert result.exit_code == 0
-        assert "recommend" in result.output.lower()
-
-    def test_recommend_no_results(self):
-        """Test recommend with no results."""
-        mock_client = Mock()
-        mock_client.get_paper_by_id.return_value = None
-        mock_client.get_recommended_papers.return_value = []
-
-        with patch('papergen.sources.semantic_scholar.SemanticScholarClient', return_value=mock_client):
-            result = runner.invoke(app, ["recommend", "test-paper-id"])
-
-            assert "no recommendations" in result.output.lower() or result.exit_code == 0
-
-
-class TestSeminalCommand:
-    """Tests for seminal command."""
-
-    def test_seminal_help(self):
-        """Test seminal command help."""
-        result = runner.invoke(app, ["seminal", "--help"])
-        assert result.exit_code == 0
-        assert "seminal" in result.output.lower()
-
-    def test_seminal_no_results(self):
-        """Test seminal with no results."""
-        mock_client = Mock()
-        mock_client.find_seminal_papers.return_value = []
-
-        with patch('papergen.sources.semantic_scholar.SemanticScholarClient', return_value=mock_client):
-            result = runner.invoke(app, ["seminal", "obscure topic"])
-
-            assert "no papers" in result.output.lower() or result.exit_code == 0
-
+        monkeypatch.setattr('papergen.discovery.brainstorm.IdeaGenerator', lambda *a, **k: mock_generator)
+        result = runner.invoke(app, ["brainstorm", "AI", "--multi"])
 
-class TestAuthorCommand:
-    """Tests for author command."""
-
-    def test_author_help(self):
-        """Test author command help."""
-        result = runner.invoke(app, ["author", "--help"])
-        assert result.exit_code == 0
-        assert "author" in result.output.lower()
-
-    def test_author_not_found(self):
-        """Test author not found."""
-        mock_client = Mock()
-        mock_client.search_authors.return_value = []
-
-        with patch('papergen.sources.semantic_scholar.SemanticScholarClient', return_value=mock_client):
-            result = runner.invoke(app, ["author", "Nonexistent Author"])
-
-            assert "no authors" in result.output.lower() or result.exit_code == 0
-
-    def test_author_with_papers(self):
-        """Test author search with papers flag."""
-        mock_paper = Mock()
-        mock_paper.title = "Test Paper"
-        mock_paper.year = 2024
-        mock_paper.citation_count = 50
-        mock_paper.venue = "ICML"
-
-        mock_client = Mock()
-        mock_client.search_authors.return_value = [
-            {'name': 'Test Author', 'authorId': '123', 'paperCount': 10, 'citationCount': 500, 'hIndex': 15}
-        ]
-        mock_client.get_author_papers.return_value = [mock_paper]
-
-        with patch('papergen.sources.semantic_scholar.SemanticScholarClient', return_value=mock_client):
-            result = runner.invoke(app, ["author", "Test Author", "--papers"])
-
-            # Should attempt to get papers
-            assert result.exit_code == 0 or mock_client.get_author_papers.called
-
-
-class TestTrendingCommand:
-    """Tests for trending command."""
-
-    def test_trending_help(self):
-        """Test trending command help."""
-        result = runner.invoke(app, ["trending", "--help"])
-        assert result.exit_code == 0
-        assert "trending" in result.output.lower()
-
-    def test_trending_no_results(self):
-        """Test trending with no results."""
-        mock_client = Mock()
-        mock_client.get_trending_papers.return_value = []
-
-        with patch('papergen.sources.semantic_scholar.SemanticScholarClient', return_value=mock_client):
-            result = runner.invoke(app, ["trending"])
-
-            assert "no papers" in result.output.lower() or result.exit_code == 0
+        # Should attempt multi-LLM mode
+        assert result.exit_code == 0 or b"error" in result.stdout_bytes.lower()
 
 
 class TestDisplayFunctions:
     """Tests for display helper functions."""
 
-    def test_display_survey_results_empty(self, capsys):
+    def test_display_survey_results_empty(self):
         """Test displaying empty survey results."""
         _display_survey_results({})
         # Should not raise error
 
-    def test_display_survey_results_with_gaps(self, capsys):
+    def test_display_survey_results_with_gaps(self):
         """Test displaying survey results with gaps."""
-        results = {
-            "research_gaps": [{"gap": "Gap 1"}, "Gap 2"],
-            "key_papers_to_read": [{"title": "Paper 1"}, "Paper 2"],
-            "future_directions": [{"direction": "Dir 1"}, "Dir 2"]
-        }
-        _display_survey_results(results)
+        _display_survey_results(_SURVEY_RESULTS)
         # Should not raise error
 
-    def test_display_paper_analysis(self, capsys):
+    def test_display_paper_analysis(self):
         """Test displaying paper analysis."""
-        results = {
-            "title": "Test Paper",
-            "core_contribution": "Test contribution",
-            "strengths": ["Strength 1"],
-            "weaknesses": ["Weakness 1"],
-            "inspiration_for_new_research": [{"idea": "Idea 1"}]
-        }
-        _display_paper_analysis(results)
+        _display_paper_analysis(_PAPER_ANALYSIS)
         # Should not raise error
 
-    def test_display_ideas(self, capsys):
+    def test_display_ideas(self):
         """Test displaying ideas."""
-        ideas = [
-            {
-                "title": "Idea 1",
-                "one_sentence": "Brief description",
-                "novelty": "High",
-                "feasibility": "Medium",
-                "potential_venues": ["NeurIPS", "ICML"],
-                "first_steps": ["Step 1", "Step 2"]
-            }
-        ]
-        _display_ideas(ideas)
+        _display_ideas(_IDEAS)
         # Should not raise error
 
-    def test_display_multi_llm_results(self, capsys):
+    def test_display_multi_llm_results(self):
         """Test displaying multi-LLM results."""
-        mock_generator = Mock()
+        mock_generator = Mock(spec_set=IdeaGenerator)
         mock_generator.get_summary.return_value = {
             "summary": "Test summary",
             "top_recommendations": [{"title": "Rec 1"}],
             "consensus_themes": ["Theme 1"]
         }
-        mock_report = Mock()
-        mock_report.provider = "openai"
-        mock_report.model = "gpt-4"
-        mock_report.ideas = [{"title": "Idea"}]
+        mock_report = SimpleNamespace(provider="openai", model="gpt-4", ideas=[{"title": "Idea"}])
         mock_generator.get_reports.return_value = [mock_report]
 
         _display_multi_llm_results(mock_generator, None)
         # Should not raise error
 
-    def test_save_reports(self):
+    def test_save_reports(self, tmp_path):
         """Test saving reports."""
-        mock_generator = Mock()
+        mock_generator = Mock(spec_set=IdeaGenerator)
         mock_generator.get_summary.return_value = {"summary": "Test"}
-        mock_report = Mock()
-        mock_report.provider = "openai"
-        mock_report.model = "gpt-4"
-        mock_report.ideas = []
+        mock_report = SimpleNamespace(provider="openai", model="gpt-4", ideas=[])
         mock_generator.get_reports.return_value = [mock_report]
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_dir = Path(tmpdir)
-            _save_reports(mock_generator, output_dir)
+        _save_reports(mock_generator, tmp_path)
 
-            # Check files were created
-            assert (output_dir / "summary.json").exists()
-            assert (output_dir / "openai_gpt-4.json").exists()
+        # Check files were created
+        assert (tmp_path / "summary.json").exists()
+        assert (tmp_path / "openai_gpt-4.json").exists()
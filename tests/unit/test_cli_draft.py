@@ -1,415 +1,352 @@
 """Tests for draft CLI commands."""
 
+import io
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from dataclasses import dataclass, field
+from unittest.mock import Mock, patch
 from pathlib import Path
-import tempfile
-import os
-import json
+from types import SimpleNamespace
 
-from typer.testing import CliRunner
+from rich.console import Console
 
-from papergen.cli.draft import app, _draft_parallel, _draft_sequential, _show_draft_preview
+import papergen.ai.claude_client as _claude_mod
+import papergen.cli.draft as _draft_mod
+import papergen.core.config as _config_mod
+from papergen.cli.draft import (
+    app, list_drafts, show_draft, show_statistics,
+    _draft_parallel, _draft_sequential, _show_draft_preview
+)
 
 
-runner = CliRunner()
+_ROOT = Path("/tmp/test")
+_OUTLINE_DIR = _ROOT / "outline"
+_RESEARCH_DIR = _ROOT / "research"
+
+_OUTLINE_STUB_JSON = '{"title": "Test", "sections": []}'
+# Longer than the 500-character cutoff used by `draft show --format preview`
+_TRUNCATED_PREVIEW_CONTENT = "Test content " * 100
+_PREVIEW_LINES = tuple(f"Line {i}" for i in range(50))
+_LONG_PREVIEW_CONTENT = "\n".join(_PREVIEW_LINES)
+
+
+@dataclass(slots=True)
+class SectionStub:
+    """Outline section with the fields the draft commands read."""
+    id: str
+    title: str = ""
+    word_count_target: int = 500
+
+
+@dataclass(slots=True)
+class DraftStub:
+    """Section draft with the fields the draft commands read."""
+    metadata: dict = field(default_factory=dict)
+    version: int = 1
+    word_count: int = 100
+    citation_keys: list = field(default_factory=list)
+    content: str = ""
+
+
+@pytest.fixture(autouse=True)
+def _quiet_console(request, monkeypatch):
+    """Silence the draft CLI console unless the test reads CliRunner output."""
+    if "runner" not in request.fixturenames:
+        monkeypatch.setattr(_draft_mod, 'console', Console(quiet=True))
+
+
+@pytest.fixture
+def console_output(monkeypatch):
+    """Route the draft CLI console into a string buffer."""
+    buffer = io.StringIO()
+    monkeypatch.setattr(_draft_mod, 'console', Console(file=buffer, width=120))
+    return buffer
+
+
+@pytest.fixture
+def mock_project():
+    """Create mock project."""
+    return SimpleNamespace(
+        root_path=_ROOT,
+        state=SimpleNamespace(),
+        get_outline_dir=lambda: _OUTLINE_DIR,
+        get_research_dir=lambda: _RESEARCH_DIR,
+        save_state=lambda: None
+    )
+
+
+@pytest.fixture
+def mock_outline():
+    """Create mock outline."""
+    section = SectionStub(id="intro", title="Introduction")
+    return SimpleNamespace(
+        get_section_by_id=lambda section_id: section,
+        get_all_sections_flat=lambda: [section]
+    )
+
+
+@pytest.fixture
+def mock_draft():
+    """Create mock draft."""
+    return DraftStub(metadata={'section_title': 'Introduction'}, content="Content")
 
 
 class TestDraftSectionCommand:
     """Tests for draft section command."""
 
-    @pytest.fixture
-    def mock_project(self):
-        """Create mock project."""
-        project = Mock()
-        project.root_path = Path("/tmp/test")
-        project.state = Mock()
-        project.get_outline_dir.return_value = Path("/tmp/test/outline")
-        project.get_research_dir.return_value = Path("/tmp/test/research")
-        return project
-
-    @pytest.fixture
-    def mock_outline(self):
-        """Create mock outline."""
-        outline = Mock()
-        section = Mock()
-        section.id = "intro"
-        section.title = "Introduction"
-        section.word_count_target = 500
-        outline.get_section_by_id.return_value = section
-        outline.get_all_sections_flat.return_value = [section]
-        return outline
-
-    def test_draft_section_no_project(self):
+    def test_draft_section_no_project(self, runner, monkeypatch):
         """Test draft section when no project exists."""
-        with patch('papergen.cli.draft._get_project') as mock_get:
-            mock_get.side_effect = SystemExit(1)
-            result = runner.invoke(app, ["draft-section", "intro"])
-            assert result.exit_code != 0
+        def no_project():
+            raise SystemExit(1)
+
+        monkeypatch.setattr(_draft_mod, '_get_project', no_project)
+        result = runner.invoke(app, ["draft-section", "intro"])
+        assert result.exit_code != 0
 
 
 class TestDraftAllCommand:
     """Tests for draft all command."""
 
-    @pytest.fixture
-    def mock_project(self):
-        """Create mock project."""
-        project = Mock()
-        project.root_path = Path("/tmp/test")
-        project.state = Mock()
-        project.get_outline_dir.return_value = Path("/tmp/test/outline")
-        project.get_research_dir.return_value = Path("/tmp/test/research")
-        project.save_state = Mock()
-        return project
-
-    def test_draft_all_no_outline(self, mock_project):
+    def test_draft_all_no_outline(self, runner, mock_project, monkeypatch, tmp_path):
         """Test draft all when no outline exists."""
-        with patch('papergen.cli.draft._get_project', return_value=mock_project):
-            with tempfile.TemporaryDirectory() as tmpdir:
-                mock_project.get_outline_dir.return_value = Path(tmpdir)
-                result = runner.invoke(app, ["all"])
-                assert result.exit_code != 0
+        monkeypatch.setattr(_draft_mod, '_get_project', lambda *a, **k: mock_project)
+        mock_project.get_outline_dir = lambda: tmp_path
+        result = runner.invoke(app, ["all"])
+        assert result.exit_code != 0
 
-    def test_draft_all_ai_disabled(self, mock_project):
+    def test_draft_all_ai_disabled(self, runner, mock_project, mock_outline, monkeypatch, tmp_path):
         """Test draft all with AI disabled."""
-        with patch('papergen.cli.draft._get_project', return_value=mock_project):
-            with patch('papergen.cli.draft.Outline') as mock_outline:
-                with tempfile.TemporaryDirectory() as tmpdir:
-                    outline_file = Path(tmpdir) / "outline.json"
-                    outline_file.write_text("{}")
-                    mock_project.get_outline_dir.return_value = Path(tmpdir)
+        monkeypatch.setattr(_draft_mod, '_get_project', lambda *a, **k: mock_project)
+        monkeypatch.setattr(
+            _draft_mod, 'Outline',
+            SimpleNamespace(from_json_file=lambda *a, **k: mock_outline)
+        )
+        outline_file = tmp_path / "outline.json"
+        outline_file.write_text("{}")
+        mock_project.get_outline_dir = lambda: tmp_path
 
-                    result = runner.invoke(app, ["all", "--no-use-ai"])
-                    assert "ai disabled" in result.output.lower()
+        result = runner.invoke(app, ["all", "--no-use-ai"])
+        assert "ai disabled" in result.output.lower()
 
 
 class TestShowDraftCommand:
     """Tests for show draft command."""
 
-    @pytest.fixture
-    def mock_project(self):
-        """Create mock project."""
-        project = Mock()
-        project.root_path = Path("/tmp/test")
-        return project
-
-    def test_show_draft_not_found(self, mock_project):
+    def test_show_draft_not_found(self, console_output, mock_project, monkeypatch):
         """Test showing nonexistent draft."""
-        mock_manager = Mock()
-        mock_manager.load_draft.return_value = None
-        mock_manager.list_drafts.return_value = []
-
-        with patch('papergen.cli.draft._get_project', return_value=mock_project):
-            with patch('papergen.cli.draft.SectionManager', return_value=mock_manager):
-                result = runner.invoke(app, ["show", "nonexistent"])
-                assert "no draft" in result.output.lower()
-
-    def test_show_draft_preview(self, mock_project):
-        """Test showing draft in preview mode."""
-        mock_draft = Mock()
-        mock_draft.metadata = {'section_title': 'Introduction'}
-        mock_draft.version = 1
-        mock_draft.word_count = 500
-        mock_draft.citation_keys = []
-        mock_draft.content = "Test content " * 100
-
-        mock_manager = Mock()
-        mock_manager.load_draft.return_value = mock_draft
-
-        with patch('papergen.cli.draft._get_project', return_value=mock_project):
-            with patch('papergen.cli.draft.SectionManager', return_value=mock_manager):
-                result = runner.invoke(app, ["show", "intro", "--format", "preview"])
-                assert result.exit_code == 0
-
-    def test_show_draft_full(self, mock_project):
-        """Test showing draft in full mode."""
-        mock_draft = Mock()
-        mock_draft.metadata = {'section_title': 'Introduction'}
-        mock_draft.version = 1
-        mock_draft.word_count = 100
-        mock_draft.citation_keys = []
-        mock_draft.content = "Full content"
-
-        mock_manager = Mock()
-        mock_manager.load_draft.return_value = mock_draft
-
-        with patch('papergen.cli.draft._get_project', return_value=mock_project):
-            with patch('papergen.cli.draft.SectionManager', return_value=mock_manager):
-                result = runner.invoke(app, ["show", "intro", "--format", "full"])
-                assert result.exit_code == 0
+        mock_manager = SimpleNamespace(
+            load_draft=lambda section_id: None,
+            list_drafts=lambda: []
+        )
+
+        monkeypatch.setattr(_draft_mod, '_get_project', lambda *a, **k: mock_project)
+        monkeypatch.setattr(_draft_mod, 'SectionManager', lambda *a, **k: mock_manager)
+        show_draft("nonexistent", format="preview")
+        assert "no draft" in console_output.getvalue().lower()
+
+    @pytest.mark.parametrize("fmt,content,expected", [
+        pytest.param("preview", _TRUNCATED_PREVIEW_CONTENT, "content truncated", id="preview"),
+        pytest.param("full", "Full content", "full content", id="full"),
+        pytest.param(
+            "markdown", "# Introduction\n\nThis is content.", "# introduction", id="markdown"
+        ),
+        pytest.param("invalid", "Content", "unknown format", id="unknown"),
+    ])
+    def test_show_draft_formats(
+        self, console_output, mock_project, mock_draft, monkeypatch, fmt, content, expected
+    ):
+        """Test showing draft in each output format."""
+        mock_draft.content = content
+        mock_manager = SimpleNamespace(load_draft=lambda section_id: mock_draft)
+
+        monkeypatch.setattr(_draft_mod, '_get_project', lambda *a, **k: mock_project)
+        monkeypatch.setattr(_draft_mod, 'SectionManager', lambda *a, **k: mock_manager)
+        show_draft("intro", format=fmt)
+        assert expected in console_output.getvalue().lower()
 
 
 class TestListDraftsCommand:
     """Tests for list drafts command."""
 
-    def test_list_drafts_empty(self):
+    def test_list_drafts_empty(self, console_output, mock_project, monkeypatch):
         """Test listing when no drafts exist."""
-        mock_project = Mock()
-        mock_project.root_path = Path("/tmp/test")
+        mock_manager = SimpleNamespace(list_drafts=lambda: [])
 
-        mock_manager = Mock()
-        mock_manager.list_drafts.return_value = []
+        monkeypatch.setattr(_draft_mod, '_get_project', lambda *a, **k: mock_project)
+        monkeypatch.setattr(_draft_mod, 'SectionManager', lambda *a, **k: mock_manager)
+        list_drafts()
+        assert "no drafts" in console_output.getvalue().lower()
 
-        with patch('papergen.cli.draft._get_project', return_value=mock_project):
-            with patch('papergen.cli.draft.SectionManager', return_value=mock_manager):
-                result = runner.invoke(app, ["list"])
-                assert "no drafts" in result.output.lower()
-
-    def test_list_drafts_with_drafts(self):
+    def test_list_drafts_with_drafts(self, console_output, mock_project, mock_draft, monkeypatch):
         """Test listing with existing drafts."""
-        mock_project = Mock()
-        mock_project.root_path = Path("/tmp/test")
-
-        mock_draft = Mock()
-        mock_draft.metadata = {'section_title': 'Introduction'}
-        mock_draft.version = 1
         mock_draft.word_count = 500
         mock_draft.citation_keys = ['cite1']
 
-        mock_manager = Mock()
-        mock_manager.list_drafts.return_value = ['intro']
-        mock_manager.load_draft.return_value = mock_draft
+        mock_manager = SimpleNamespace(
+            list_drafts=lambda: ['intro'],
+            load_draft=lambda section_id: mock_draft
+        )
 
-        with patch('papergen.cli.draft._get_project', return_value=mock_project):
-            with patch('papergen.cli.draft.SectionManager', return_value=mock_manager):
-                result = runner.invoke(app, ["list"])
-                assert result.exit_code == 0
-                assert "intro" in result.output
+        monkeypatch.setattr(_draft_mod, '_get_project', lambda *a, **k: mock_project)
+        monkeypatch.setattr(_draft_mod, 'SectionManager', lambda *a, **k: mock_manager)
+        list_drafts()
+        assert "intro" in console_output.getvalue()
 
 
 class TestShowStatisticsCommand:
     """Tests for stats command."""
 
-    def test_show_statistics(self):
+    def test_show_statistics(self, console_output, mock_project, monkeypatch):
         """Test showing statistics."""
-        mock_project = Mock()
-        mock_project.root_path = Path("/tmp/test")
-
-        mock_manager = Mock()
-        mock_manager.get_statistics.return_value = {
+        stats = {
             'sections_drafted': 3,
             'total_words': 1500,
             'total_citations': 10,
             'average_words_per_section': 500
         }
+        mock_manager = SimpleNamespace(get_statistics=lambda: stats)
 
-        with patch('papergen.cli.draft._get_project', return_value=mock_project):
-            with patch('papergen.cli.draft.SectionManager', return_value=mock_manager):
-                result = runner.invoke(app, ["stats"])
-                assert result.exit_code == 0
-                assert "1500" in result.output
+        monkeypatch.setattr(_draft_mod, '_get_project', lambda *a, **k: mock_project)
+        monkeypatch.setattr(_draft_mod, 'SectionManager', lambda *a, **k: mock_manager)
+        show_statistics()
+        assert "1500" in console_output.getvalue()
 
 
 class TestDraftHelperFunctions:
     """Tests for helper functions."""
 
-    def test_show_draft_preview_short_content(self):
+    def test_show_draft_preview_short_content(self, monkeypatch):
         """Test preview with short content."""
-        # Just verify it doesn't crash
-        with patch('papergen.cli.draft.console') as mock_console:
-            _show_draft_preview("Short content", max_lines=10)
-            mock_console.print.assert_called()
-
-    def test_show_draft_preview_long_content(self):
+        printed = []
+        monkeypatch.setattr(
+            _draft_mod, 'console',
+            SimpleNamespace(print=lambda *a, **k: printed.append(a))
+        )
+        _show_draft_preview("Short content", max_lines=10)
+        assert printed
+
+    def test_show_draft_preview_long_content(self, monkeypatch):
         """Test preview with long content."""
-        long_content = "\n".join([f"Line {i}" for i in range(50)])
-        with patch('papergen.cli.draft.console') as mock_console:
-            _show_draft_preview(long_content, max_lines=10)
-            mock_console.print.assert_called()
+        printed = []
+        monkeypatch.setattr(
+            _draft_mod, 'console',
+            SimpleNamespace(print=lambda *a, **k: printed.append(a))
+        )
+        _show_draft_preview(_LONG_PREVIEW_CONTENT, max_lines=10)
+        assert f"{len(_PREVIEW_LINES) - 10} more lines" in printed[-1][0]
 
 
 class TestReviewCommand:
     """Tests for review command."""
 
-    def test_review_no_draft(self):
+    def test_review_no_draft(self, runner, mock_project, monkeypatch):
         """Test reviewing nonexistent draft."""
-        mock_project = Mock()
-        mock_project.root_path = Path("/tmp/test")
+        mock_manager = SimpleNamespace(get_draft_content=lambda section_id: None)
 
-        mock_manager = Mock()
-        mock_manager.get_draft_content.return_value = None
+        monkeypatch.setattr(_draft_mod, '_get_project', lambda *a, **k: mock_project)
+        monkeypatch.setattr(_draft_mod, 'SectionManager', lambda *a, **k: mock_manager)
+        result = runner.invoke(app, ["review", "nonexistent"])
+        assert "no draft" in result.output.lower()
 
-        with patch('papergen.cli.draft._get_project', return_value=mock_project):
-            with patch('papergen.cli.draft.SectionManager', return_value=mock_manager):
-                result = runner.invoke(app, ["review", "nonexistent"])
-                assert "no draft" in result.output.lower()
-
-    def test_review_with_draft(self):
+    def test_review_with_draft(self, runner, mock_project, monkeypatch):
         """Test reviewing existing draft."""
-        mock_project = Mock()
-        mock_project.root_path = Path("/tmp/test")
-
         mock_manager = Mock()
         mock_manager.get_draft_content.return_value = "Some draft content"
         mock_manager.review_section.return_value = "This section is well written."
 
-        mock_claude = Mock()
+        mock_claude = SimpleNamespace()
 
-        with patch('papergen.cli.draft._get_project', return_value=mock_project):
-            with patch('papergen.cli.draft.SectionManager', return_value=mock_manager):
-                with patch('papergen.ai.claude_client.ClaudeClient', return_value=mock_claude):
-                    result = runner.invoke(app, ["review", "intro"])
-                    # Should either succeed or attempt review
-                    assert mock_manager.get_draft_content.called
+        monkeypatch.setattr(_draft_mod, '_get_project', lambda *a, **k: mock_project)
+        monkeypatch.setattr(_draft_mod, 'SectionManager', lambda *a, **k: mock_manager)
+        monkeypatch.setattr(_claude_mod, 'ClaudeClient', lambda *a, **k: mock_claude)
+        result = runner.invoke(app, ["review", "intro"])
+        # Should either succeed or attempt review
+        assert mock_manager.get_draft_content.called
 
 
 class TestDraftSectionNoOutline:
     """Tests for draft section when outline doesn't exist."""
 
-    def test_draft_section_no_outline(self):
+    def test_draft_section_no_outline(self, runner, mock_project, monkeypatch, tmp_path):
         """Test draft section when outline doesn't exist."""
-        mock_project = Mock()
-        mock_project.root_path = Path("/tmp/test")
-        mock_project.state = Mock()
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            mock_project.get_outline_dir.return_value = Path(tmpdir)
+        mock_project.get_outline_dir = lambda: tmp_path
 
-            with patch('papergen.cli.draft._get_project', return_value=mock_project):
-                result = runner.invoke(app, ["draft-section", "intro"])
-                assert result.exit_code != 0
-                assert "no outline" in result.output.lower()
+        monkeypatch.setattr(_draft_mod, '_get_project', lambda *a, **k: mock_project)
+        result = runner.invoke(app, ["draft-section", "intro"])
+        assert result.exit_code != 0
+        assert "no outline" in result.output.lower()
 
 
 class TestDraftSectionNotFound:
     """Tests for draft section when section not found."""
 
-    def test_draft_section_not_found(self):
+    def test_draft_section_not_found(self, runner, mock_project, monkeypatch, tmp_path):
         """Test draft section when section not in outline."""
-        mock_project = Mock()
-        mock_project.root_path = Path("/tmp/test")
-        mock_project.state = Mock()
+        mock_section = SectionStub(id="intro")
+        mock_outline = SimpleNamespace(
+            get_section_by_id=lambda section_id: None,
+            get_all_sections_flat=lambda: [mock_section]
+        )
 
-        mock_outline = Mock()
-        mock_outline.get_section_by_id.return_value = None
-        mock_section = Mock()
-        mock_section.id = "intro"
-        mock_outline.get_all_sections_flat.return_value = [mock_section]
+        outline_file = tmp_path / "outline.json"
+        outline_file.write_text(_OUTLINE_STUB_JSON)
+        mock_project.get_outline_dir = lambda: tmp_path
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            outline_file = Path(tmpdir) / "outline.json"
-            outline_file.write_text('{"title": "Test", "sections": []}')
-            mock_project.get_outline_dir.return_value = Path(tmpdir)
-
-            with patch('papergen.cli.draft._get_project', return_value=mock_project):
-                with patch('papergen.cli.draft.Outline.from_json_file', return_value=mock_outline):
-                    result = runner.invoke(app, ["draft-section", "nonexistent"])
-                    assert result.exit_code != 0
-                    assert "not found" in result.output.lower()
+        monkeypatch.setattr(_draft_mod, '_get_project', lambda *a, **k: mock_project)
+        monkeypatch.setattr(
+            _draft_mod.Outline, 'from_json_file', lambda *a, **k: mock_outline
+        )
+        result = runner.invoke(app, ["draft-section", "nonexistent"])
+        assert result.exit_code != 0
+        assert "not found" in result.output.lower()
 
 
 class TestDraftSectionAIDisabled:
     """Tests for draft section with AI disabled."""
 
-    def test_draft_section_ai_disabled(self):
+    def test_draft_section_ai_disabled(
+        self, runner, mock_project, mock_outline, monkeypatch, tmp_path
+    ):
         """Test draft section with AI disabled."""
-        mock_project = Mock()
-        mock_project.root_path = Path("/tmp/test")
-        mock_project.state = Mock()
-
-        mock_section = Mock()
-        mock_section.id = "intro"
-        mock_section.title = "Introduction"
-        mock_section.word_count_target = 500
-
-        mock_outline = Mock()
-        mock_outline.get_section_by_id.return_value = mock_section
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            outline_file = Path(tmpdir) / "outline.json"
-            outline_file.write_text('{"title": "Test", "sections": []}')
-            mock_project.get_outline_dir.return_value = Path(tmpdir)
-            mock_project.get_research_dir.return_value = Path(tmpdir)
+        outline_file = tmp_path / "outline.json"
+        outline_file.write_text(_OUTLINE_STUB_JSON)
+        mock_project.get_outline_dir = lambda: tmp_path
+        mock_project.get_research_dir = lambda: tmp_path
 
-            with patch('papergen.cli.draft._get_project', return_value=mock_project):
-                with patch('papergen.cli.draft.Outline.from_json_file', return_value=mock_outline):
-                    result = runner.invoke(app, ["draft-section", "intro", "--no-use-ai"])
-                    assert "ai disabled" in result.output.lower()
+        monkeypatch.setattr(_draft_mod, '_get_project', lambda *a, **k: mock_project)
+        monkeypatch.setattr(
+            _draft_mod.Outline, 'from_json_file', lambda *a, **k: mock_outline
+        )
+        result = runner.invoke(app, ["draft-section", "intro", "--no-use-ai"])
+        assert "ai disabled" in result.output.lower()
 
 
 class TestDraftAllSkipExisting:
     """Tests for draft all with skip existing."""
 
-    def test_draft_all_all_drafted(self):
+    def test_draft_all_all_drafted(self, runner, mock_project, mock_outline, tmp_path):
         """Test draft all when all sections already drafted."""
-        mock_project = Mock()
-        mock_project.root_path = Path("/tmp/test")
-        mock_project.state = Mock()
-
-        mock_section = Mock()
-        mock_section.id = "intro"
-        mock_section.title = "Introduction"
-
-        mock_outline = Mock()
-        mock_outline.get_all_sections_flat.return_value = [mock_section]
-
-        mock_section_manager = Mock()
-        mock_section_manager.get_draft_content.return_value = "Existing content"
-
-        mock_claude = Mock()
-        mock_config = Mock()
-        mock_config.get_citation_style.return_value = "apa"
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            outline_file = Path(tmpdir) / "outline.json"
-            outline_file.write_text('{"title": "Test", "sections": []}')
-            mock_project.get_outline_dir.return_value = Path(tmpdir)
-            mock_project.get_research_dir.return_value = Path(tmpdir)
-
-            with patch('papergen.cli.draft._get_project', return_value=mock_project):
-                with patch('papergen.cli.draft.Outline.from_json_file', return_value=mock_outline):
-                    with patch('papergen.ai.claude_client.ClaudeClient', return_value=mock_claude):
-                        with patch('papergen.cli.draft.SectionManager', return_value=mock_section_manager):
-                            with patch('papergen.cli.draft.CitationManager') as mock_citation:
-                                with patch('papergen.core.config.config', mock_config):
-                                    result = runner.invoke(app, ["all"])
-                                    assert "all sections already drafted" in result.output.lower()
-
-
-class TestShowDraftFormats:
-    """Tests for show draft with different formats."""
-
-    @pytest.fixture
-    def mock_project(self):
-        """Create mock project."""
-        project = Mock()
-        project.root_path = Path("/tmp/test")
-        return project
-
-    def test_show_draft_markdown_format(self, mock_project):
-        """Test showing draft in markdown format."""
-        mock_draft = Mock()
-        mock_draft.metadata = {'section_title': 'Introduction'}
-        mock_draft.version = 1
-        mock_draft.word_count = 100
-        mock_draft.citation_keys = []
-        mock_draft.content = "# Introduction\n\nThis is content."
-
-        mock_manager = Mock()
-        mock_manager.load_draft.return_value = mock_draft
-
-        with patch('papergen.cli.draft._get_project', return_value=mock_project):
-            with patch('papergen.cli.draft.SectionManager', return_value=mock_manager):
-                result = runner.invoke(app, ["show", "intro", "--format", "markdown"])
-                assert result.exit_code == 0
-                assert "Introduction" in result.output
-
-    def test_show_draft_unknown_format(self, mock_project):
-        """Test showing draft with unknown format."""
-        mock_draft = Mock()
-        mock_draft.metadata = {'section_title': 'Introduction'}
-        mock_draft.version = 1
-        mock_draft.word_count = 100
-        mock_draft.citation_keys = []
-        mock_draft.content = "Content"
-
-        mock_manager = Mock()
-        mock_manager.load_draft.return_value = mock_draft
-
-        with patch('papergen.cli.draft._get_project', return_value=mock_project):
-            with patch('papergen.cli.draft.SectionManager', return_value=mock_manager):
-                result = runner.invoke(app, ["show", "intro", "--format", "invalid"])
-                assert "unknown format" in result.output.lower()
+        mock_section_manager = SimpleNamespace(
+            get_draft_content=lambda section_id: "Existing content"
+        )
+
+        mock_claude = SimpleNamespace()
+        mock_config = SimpleNamespace(get_citation_style=lambda: "apa")
+
+        outline_file = tmp_path / "outline.json"
+        outline_file.write_text(_OUTLINE_STUB_JSON)
+        mock_project.get_outline_dir = lambda: tmp_path
+        mock_project.get_research_dir = lambda: tmp_path
+
+        with patch.multiple(
+            _draft_mod,
+            _get_project=lambda: mock_project,
+            SectionManager=lambda *a, **k: mock_section_manager,
+            CitationManager=lambda *a, **k: SimpleNamespace()
+        ), patch.object(_draft_mod.Outline, 'from_json_file', return_value=mock_outline), \
+                patch.object(_claude_mod, 'ClaudeClient', return_value=mock_claude), \
+                patch.object(_config_mod, 'config', mock_config):
+            result = runner.invoke(app, ["all"])
+            assert "all sections already drafted" in result.output.lower()
 
 
 class TestDraftSequential:
@@ -417,85 +354,59 @@ class TestDraftSequential:
 
     def test_draft_sequential(self):
         """Test sequential drafting of sections."""
-        mock_section = Mock()
-        mock_section.id = "intro"
-        mock_section.title = "Introduction"
+        mock_section = SectionStub(id="intro", title="Introduction")
 
-        mock_draft = Mock()
-        mock_draft.word_count = 500
-        mock_draft.citation_keys = []
+        mock_draft = DraftStub(word_count=500)
 
         mock_manager = Mock()
         mock_manager.draft_section.return_value = mock_draft
 
-        with patch('papergen.cli.draft.console'):
-            _draft_sequential([mock_section], mock_manager, "Research text")
+        _draft_sequential([mock_section], mock_manager, "Research text")
 
-            mock_manager.draft_section.assert_called_once()
-            mock_manager.save_draft.assert_called_once()
+        mock_manager.draft_section.assert_called_once()
+        mock_manager.save_draft.assert_called_once()
 
 
 class TestDraftParallel:
     """Tests for parallel drafting."""
 
-    def test_draft_parallel(self):
+    def test_draft_parallel(self, console_output, monkeypatch):
         """Test parallel drafting of sections."""
-        from papergen.document.parallel import ParallelSectionManager, DraftTask
+        import papergen.document.parallel as parallel_mod
 
-        mock_section1 = Mock()
-        mock_section1.id = "intro"
-        mock_section1.title = "Introduction"
+        mock_section1 = SectionStub(id="intro", title="Introduction")
+        mock_section2 = SectionStub(id="methods", title="Methods")
+        drafted_tasks = []
+        stats_calls = []
 
-        mock_section2 = Mock()
-        mock_section2.id = "methods"
-        mock_section2.title = "Methods"
+        def get_statistics():
+            stats_calls.append(True)
+            return {'successful': 2, 'failed': 0, 'total_duration': 10.5}
 
-        mock_manager = Mock()
+        def draft_sections_parallel(tasks, skip_existing=True):
+            drafted_tasks.extend(tasks)
+            return []
 
-        mock_parallel_mgr = Mock()
-        mock_parallel_mgr.draft_sections_parallel.return_value = []
-        mock_parallel_mgr.get_statistics.return_value = {
-            'successful': 2,
-            'failed': 0,
-            'total_duration': 10.5
-        }
+        monkeypatch.setattr(
+            parallel_mod, 'ParallelSectionManager',
+            lambda *a, **k: SimpleNamespace(
+                draft_sections_parallel=draft_sections_parallel,
+                get_statistics=get_statistics
+            )
+        )
+        _draft_parallel([mock_section1, mock_section2], SimpleNamespace(), "Research", 2)
 
-        with patch('papergen.cli.draft.console'):
-            with patch.object(ParallelSectionManager, '__init__', return_value=None):
-                with patch.object(ParallelSectionManager, 'draft_sections_parallel', return_value=[]):
-                    with patch.object(ParallelSectionManager, 'get_statistics', return_value={
-                        'successful': 2,
-                        'failed': 0,
-                        'total_duration': 10.5
-                    }):
-                        # The function should run without error
-                        try:
-                            _draft_parallel([mock_section1, mock_section2], mock_manager, "Research", 2)
-                        except Exception:
-                            pass  # May fail due to internal issues, but we're testing the setup
+        assert [task.section.id for task in drafted_tasks] == ["intro", "methods"]
+        assert len(stats_calls) == 1
+        assert "10.5s" in console_output.getvalue()
 
 
 class TestDraftAllWithResearch:
     """Tests for draft all with research file."""
 
-    def test_draft_all_with_research(self):
+    def test_draft_all_with_research(self, runner, mock_project, mock_outline, tmp_path):
         """Test draft all reads research file."""
-        mock_project = Mock()
-        mock_project.root_path = Path("/tmp/test")
-        mock_project.state = Mock()
-        mock_project.save_state = Mock()
-
-        mock_section = Mock()
-        mock_section.id = "intro"
-        mock_section.title = "Introduction"
-        mock_section.word_count_target = 500
-
-        mock_outline = Mock()
-        mock_outline.get_all_sections_flat.return_value = [mock_section]
-
-        mock_draft = Mock()
-        mock_draft.word_count = 500
-        mock_draft.citation_keys = []
+        mock_draft = DraftStub(word_count=500)
 
         mock_section_manager = Mock()
         mock_section_manager.get_draft_content.return_value = None  # Not drafted yet
@@ -506,40 +417,39 @@ class TestDraftAllWithResearch:
             'total_citations': 0
         }
 
-        mock_claude = Mock()
-        mock_citation_manager = Mock()
-        mock_config = Mock()
-        mock_config.get_citation_style.return_value = "apa"
+        mock_claude = SimpleNamespace()
+        mock_citation_manager = SimpleNamespace()
+        mock_config = SimpleNamespace(get_citation_style=lambda: "apa")
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            outline_file = Path(tmpdir) / "outline.json"
-            outline_file.write_text('{}')
-            research_file = Path(tmpdir) / "organized_notes.md"
-            research_file.write_text("Research notes content")
+        outline_file = tmp_path / "outline.json"
+        outline_file.write_text('{}')
+        research_file = tmp_path / "organized_notes.md"
+        research_file.write_text("Research notes content")
 
-            mock_project.get_outline_dir.return_value = Path(tmpdir)
-            mock_project.get_research_dir.return_value = Path(tmpdir)
+        mock_project.get_outline_dir = lambda: tmp_path
+        mock_project.get_research_dir = lambda: tmp_path
 
-            with patch('papergen.cli.draft._get_project', return_value=mock_project):
-                with patch('papergen.cli.draft.Outline.from_json_file', return_value=mock_outline):
-                    with patch('papergen.ai.claude_client.ClaudeClient', return_value=mock_claude):
-                        with patch('papergen.cli.draft.SectionManager', return_value=mock_section_manager):
-                            with patch('papergen.cli.draft.CitationManager', return_value=mock_citation_manager):
-                                with patch('papergen.core.config.config', mock_config):
-                                    result = runner.invoke(app, ["all", "--no-parallel"])
+        with patch.multiple(
+            _draft_mod,
+            _get_project=lambda: mock_project,
+            SectionManager=lambda *a, **k: mock_section_manager,
+            CitationManager=lambda *a, **k: mock_citation_manager
+        ), patch.object(_draft_mod.Outline, 'from_json_file', return_value=mock_outline), \
+                patch.object(_claude_mod, 'ClaudeClient', return_value=mock_claude), \
+                patch.object(_config_mod, 'config', mock_config):
+            result = runner.invoke(app, ["all", "--no-parallel"])
 
-                                    # Check that drafting was attempted
-                                    assert mock_section_manager.draft_section.called or "Error" in result.output
+            # Check that drafting was attempted
+            assert mock_section_manager.draft_section.called or "Error" in result.output
 
 
 class TestGetProject:
     """Tests for _get_project helper."""
 
-    def test_get_project_delegates(self):
+    def test_get_project_delegates(self, monkeypatch):
         """Test _get_project delegates to main module."""
-        from papergen.cli.draft import _get_project
+        from papergen.cli import main as cli_main
 
-        mock_project = Mock()
-        with patch('papergen.cli.main._get_project', return_value=mock_project):
-            result = _get_project()
-            assert result == mock_project
+        mock_project = object()
+        monkeypatch.setattr(cli_main, '_get_project', lambda: mock_project)
+        assert _draft_mod._get_project() is mock_project
@@ -1,263 +1,252 @@
 """Tests for format CLI commands."""
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock
-from pathlib import Path
-import tempfile
+from unittest.mock import DEFAULT, Mock, patch
 import subprocess
 
-from typer.testing import CliRunner
 
-from papergen.cli.format import app
+_CMD_LATEX = ("latex",)
+_CMD_MARKDOWN = ("markdown",)
+_CMD_MARKDOWN_NO_TOC = ("markdown", "--no-toc")
+_CMD_COMPILE = ("compile",)
+_CMD_PREVIEW = ("preview",)
+_CMD_PREVIEW_LATEX = ("preview", "--format", "latex")
+_CMD_STATS = ("stats",)
 
 
-runner = CliRunner()
+@pytest.fixture(scope="session")
+def fmt_mod():
+    """The papergen.cli.format module, imported on first use rather than at collection."""
+    from papergen.cli import format as fmt_mod
+    return fmt_mod
+
+
+@pytest.fixture(scope="session")
+def app(fmt_mod):
+    """The format Typer app."""
+    return fmt_mod.app
+
+
+@pytest.fixture
+def mock_section_manager(request):
+    """SectionManager mock; parametrize indirectly to change the listed drafts."""
+    manager = Mock()
+    manager.list_drafts.return_value = getattr(request, "param", ["intro"])
+    manager.get_draft_content.return_value = "Content"
+    return manager
+
+
+@pytest.fixture
+def mock_citation_manager():
+    """CitationManager mock with no citations."""
+    manager = Mock()
+    manager.citations = {}
+    return manager
 
 
 class TestFormatLatexCommand:
     """Tests for format latex command."""
 
     @pytest.fixture
-    def mock_project(self):
+    def mock_project(self, make_mock_project, tmp_path):
         """Create mock project."""
-        project = Mock()
-        project.root_path = Path("/tmp/test")
-        project.state = Mock()
-        project.state.template = "ieee"
-        project.state.metadata = Mock()
-        project.state.metadata.title = "Test Paper"
-        project.state.metadata.authors = ["Author One"]
-        project.state.metadata.keywords = ["ai"]
-        project.state.topic = "Test Topic"
-        project.get_outline_dir.return_value = Path("/tmp/test/outline")
-        project.get_research_dir.return_value = Path("/tmp/test/research")
-        project.get_output_dir.return_value = Path("/tmp/test/output")
-        return project
-
-    def test_format_latex_no_drafts(self, mock_project):
-        """Test format latex when no drafts exist."""
-        mock_manager = Mock()
-        mock_manager.list_drafts.return_value = []
-
-        with patch('papergen.cli.format._get_project', return_value=mock_project):
-            with patch('papergen.cli.format.SectionManager', return_value=mock_manager):
-                with tempfile.TemporaryDirectory() as tmpdir:
-                    mock_project.get_outline_dir.return_value = Path(tmpdir)
-                    mock_project.get_output_dir.return_value = Path(tmpdir)
-
-                    result = runner.invoke(app, ["latex"])
-                    assert result.exit_code != 0
-                    assert "no drafts" in result.output.lower()
+        return make_mock_project(authors=["Author One"], keywords=["ai"], root=tmp_path)
 
-    def test_format_latex_success(self, mock_project):
+    @pytest.mark.parametrize("mock_section_manager", [[]], indirect=True)
+    def test_format_latex_no_drafts(self, runner, app, fmt_mod, mock_project, mock_section_manager):
+        """Test format latex when no drafts exist."""
+        with patch.multiple(
+            fmt_mod,
+            _get_project=DEFAULT,
+            SectionManager=DEFAULT
+        ) as mocks:
+            mocks['_get_project'].return_value = mock_project
+            mocks['SectionManager'].return_value = mock_section_manager
+
+            result = runner.invoke(app, _CMD_LATEX)
+            assert result.exit_code != 0
+            assert "no drafts" in result.output.lower()
+
+    @pytest.mark.parametrize("mock_section_manager", [["intro", "methods"]], indirect=True)
+    def test_format_latex_success(
+        self, runner, app, fmt_mod, mock_project, mock_section_manager, mock_citation_manager
+    ):
         """Test successful LaTeX generation."""
-        mock_manager = Mock()
-        mock_manager.list_drafts.return_value = ['intro', 'methods']
-        mock_manager.get_draft_content.return_value = "Test content"
-
-        mock_citation_manager = Mock()
-        mock_citation_manager.citations = {}
-
         mock_builder = Mock()
         mock_builder.build.return_value = "\\documentclass{article}\\begin{document}Test\\end{document}"
 
-        with patch('papergen.cli.format._get_project', return_value=mock_project):
-            with patch('papergen.cli.format.SectionManager', return_value=mock_manager):
-                with patch('papergen.cli.format.LaTeXBuilder', return_value=mock_builder):
-                    with patch('papergen.cli.format.CitationManager') as mock_cm_class:
-                        mock_cm_class.return_value = mock_citation_manager
-                        mock_cm_class.load.return_value = mock_citation_manager
-
-                        with tempfile.TemporaryDirectory() as tmpdir:
-                            mock_project.get_output_dir.return_value = Path(tmpdir)
-                            mock_project.get_research_dir.return_value = Path(tmpdir)
+        with patch.multiple(
+            fmt_mod,
+            _get_project=DEFAULT,
+            SectionManager=DEFAULT,
+            LaTeXBuilder=DEFAULT,
+            CitationManager=DEFAULT
+        ) as mocks:
+            mocks['_get_project'].return_value = mock_project
+            mocks['SectionManager'].return_value = mock_section_manager
+            mocks['LaTeXBuilder'].return_value = mock_builder
+            mocks['CitationManager'].return_value = mock_citation_manager
+            mocks['CitationManager'].load.return_value = mock_citation_manager
 
-                            result = runner.invoke(app, ["latex"])
-                            assert result.exit_code == 0
-                            assert "saved" in result.output.lower()
+            result = runner.invoke(app, _CMD_LATEX)
+            assert result.exit_code == 0
+            assert "saved" in result.output.lower()
 
 
 class TestFormatMarkdownCommand:
     """Tests for format markdown command."""
 
     @pytest.fixture
-    def mock_project(self):
+    def mock_project(self, make_mock_project, tmp_path):
         """Create mock project."""
-        project = Mock()
-        project.root_path = Path("/tmp/test")
-        project.state = Mock()
-        project.state.template = "standard"
-        project.state.metadata = Mock()
-        project.state.metadata.title = "Test Paper"
-        project.state.metadata.authors = ["Author"]
-        project.state.metadata.keywords = []
-        project.state.topic = "Topic"
-        project.get_research_dir.return_value = Path("/tmp/test/research")
-        project.get_output_dir.return_value = Path("/tmp/test/output")
-        project.save_state = Mock()
-        return project
-
-    def test_format_markdown_no_drafts(self, mock_project):
+        return make_mock_project(
+            template="standard", authors=["Author"], topic="Topic", root=tmp_path
+        )
+
+    @pytest.mark.parametrize("mock_section_manager", [[]], indirect=True)
+    def test_format_markdown_no_drafts(
+        self, runner, app, fmt_mod, mock_project, mock_section_manager
+    ):
         """Test markdown format when no drafts exist."""
-        mock_manager = Mock()
-        mock_manager.list_drafts.return_value = []
-
-        with patch('papergen.cli.format._get_project', return_value=mock_project):
-            with patch('papergen.cli.format.SectionManager', return_value=mock_manager):
-                result = runner.invoke(app, ["markdown"])
-                assert result.exit_code != 0
-
-    def test_format_markdown_success(self, mock_project):
+        with patch.multiple(
+            fmt_mod,
+            _get_project=DEFAULT,
+            SectionManager=DEFAULT
+        ) as mocks:
+            mocks['_get_project'].return_value = mock_project
+            mocks['SectionManager'].return_value = mock_section_manager
+            result = runner.invoke(app, _CMD_MARKDOWN)
+            assert result.exit_code != 0
+
+    def test_format_markdown_success(
+        self, runner, app, fmt_mod, mock_project, mock_section_manager, mock_citation_manager
+    ):
         """Test successful markdown generation."""
-        mock_manager = Mock()
-        mock_manager.list_drafts.return_value = ['intro']
-        mock_manager.get_draft_content.return_value = "Content"
-
-        mock_citation_manager = Mock()
-        mock_citation_manager.citations = {}
-
         mock_builder = Mock()
         mock_builder.build.return_value = "# Test Paper\n\nContent"
 
-        with patch('papergen.cli.format._get_project', return_value=mock_project):
-            with patch('papergen.cli.format.SectionManager', return_value=mock_manager):
-                with patch('papergen.cli.format.MarkdownBuilder', return_value=mock_builder):
-                    with patch('papergen.cli.format.CitationManager') as mock_cm_class:
-                        mock_cm_class.return_value = mock_citation_manager
-                        mock_cm_class.load.return_value = mock_citation_manager
-
-                        with tempfile.TemporaryDirectory() as tmpdir:
-                            mock_project.get_output_dir.return_value = Path(tmpdir)
-                            mock_project.get_research_dir.return_value = Path(tmpdir)
-
-                            result = runner.invoke(app, ["markdown"])
-                            assert result.exit_code == 0
-
-    def test_format_markdown_without_toc(self, mock_project):
+        with patch.multiple(
+            fmt_mod,
+            _get_project=DEFAULT,
+            SectionManager=DEFAULT,
+            MarkdownBuilder=DEFAULT,
+            CitationManager=DEFAULT
+        ) as mocks:
+            mocks['_get_project'].return_value = mock_project
+            mocks['SectionManager'].return_value = mock_section_manager
+            mocks['MarkdownBuilder'].return_value = mock_builder
+            mocks['CitationManager'].return_value = mock_citation_manager
+            mocks['CitationManager'].load.return_value = mock_citation_manager
+
+            result = runner.invoke(app, _CMD_MARKDOWN)
+            assert result.exit_code == 0
+
+    def test_format_markdown_without_toc(
+        self, runner, app, fmt_mod, mock_project, mock_section_manager, mock_citation_manager
+    ):
         """Test markdown without table of contents."""
-        mock_manager = Mock()
-        mock_manager.list_drafts.return_value = ['intro']
-        mock_manager.get_draft_content.return_value = "Content"
-
-        mock_citation_manager = Mock()
-        mock_citation_manager.citations = {}
-
         mock_builder = Mock()
         mock_builder.build.return_value = "# Test\n\nContent"
 
-        with patch('papergen.cli.format._get_project', return_value=mock_project):
-            with patch('papergen.cli.format.SectionManager', return_value=mock_manager):
-                with patch('papergen.cli.format.MarkdownBuilder', return_value=mock_builder):
-                    with patch('papergen.cli.format.CitationManager') as mock_cm_class:
-                        mock_cm_class.return_value = mock_citation_manager
-
-                        with tempfile.TemporaryDirectory() as tmpdir:
-                            mock_project.get_output_dir.return_value = Path(tmpdir)
-                            mock_project.get_research_dir.return_value = Path(tmpdir)
+        with patch.multiple(
+            fmt_mod,
+            _get_project=DEFAULT,
+            SectionManager=DEFAULT,
+            MarkdownBuilder=DEFAULT,
+            CitationManager=DEFAULT
+        ) as mocks:
+            mocks['_get_project'].return_value = mock_project
+            mocks['SectionManager'].return_value = mock_section_manager
+            mocks['MarkdownBuilder'].return_value = mock_builder
+            mocks['CitationManager'].return_value = mock_citation_manager
 
-                            result = runner.invoke(app, ["markdown", "--no-toc"])
-                            assert result.exit_code == 0
+            result = runner.invoke(app, _CMD_MARKDOWN_NO_TOC)
+            assert result.exit_code == 0
 
 
 class TestCompileLatexCommand:
     """Tests for compile command."""
 
     @pytest.fixture
-    def mock_project(self):
+    def mock_project(self, make_mock_project, tmp_path):
         """Create mock project."""
-        project = Mock()
-        project.root_path = Path("/tmp/test")
-        project.state = Mock()
-        project.get_output_dir.return_value = Path("/tmp/test/output")
-        project.save_state = Mock()
-        return project
-
-    def test_compile_no_source(self, mock_project):
+        return make_mock_project(root=tmp_path)
+
+    def test_compile_no_source(self, runner, app, fmt_mod, mock_project, tmp_path):
         """Test compile when no source exists."""
-        with patch('papergen.cli.format._get_project', return_value=mock_project):
-            with tempfile.TemporaryDirectory() as tmpdir:
-                mock_project.get_output_dir.return_value = Path(tmpdir)
-                result = runner.invoke(app, ["compile"])
-                assert result.exit_code != 0
-                assert "not found" in result.output.lower()
-
-    def test_compile_no_latex_installed(self, mock_project):
+        with patch.object(fmt_mod, '_get_project', return_value=mock_project):
+            result = runner.invoke(app, _CMD_COMPILE)
+            assert result.exit_code != 0
+            assert "not found" in result.output.lower()
+
+    def test_compile_no_latex_installed(
+        self, runner, app, fmt_mod, mock_project, monkeypatch, tmp_path
+    ):
         """Test compile when LaTeX not installed."""
-        with patch('papergen.cli.format._get_project', return_value=mock_project):
-            with patch('subprocess.run') as mock_run:
-                mock_run.side_effect = FileNotFoundError()
+        def latex_missing(*args, **kwargs):
+            raise FileNotFoundError()
 
-                with tempfile.TemporaryDirectory() as tmpdir:
-                    tex_file = Path(tmpdir) / "paper.tex"
-                    tex_file.write_text("\\documentclass{article}")
-                    mock_project.get_output_dir.return_value = Path(tmpdir)
+        monkeypatch.setattr(subprocess, "run", latex_missing)
+        with patch.object(fmt_mod, '_get_project', return_value=mock_project):
+            tex_file = tmp_path / "paper.tex"
+            tex_file.write_text("\\documentclass{article}")
 
-                    result = runner.invoke(app, ["compile"])
-                    assert result.exit_code != 0
-                    assert "not found" in result.output.lower()
+            result = runner.invoke(app, _CMD_COMPILE)
+            assert result.exit_code != 0
+            assert "not found" in result.output.lower()
 
 
 class TestPreviewCommand:
     """Tests for preview command."""
 
     @pytest.fixture
-    def mock_project(self):
+    def mock_project(self, make_mock_project, tmp_path):
         """Create mock project."""
-        project = Mock()
-        project.root_path = Path("/tmp/test")
-        project.state = Mock()
-        project.state.template = "ieee"
-        project.state.metadata = Mock()
-        project.state.metadata.title = "Test"
-        project.state.metadata.authors = []
-        project.state.metadata.keywords = []
-        project.state.topic = "Topic"
-        project.get_research_dir.return_value = Path("/tmp/test/research")
-        return project
-
-    def test_preview_no_drafts(self, mock_project):
-        """Test preview when no drafts exist."""
-        mock_manager = Mock()
-        mock_manager.list_drafts.return_value = []
+        return make_mock_project(title="Test", topic="Topic", root=tmp_path)
 
-        with patch('papergen.cli.format._get_project', return_value=mock_project):
-            with patch('papergen.cli.format.SectionManager', return_value=mock_manager):
-                result = runner.invoke(app, ["preview"])
-                assert "no drafts" in result.output.lower()
-
-    def test_preview_latex(self, mock_project):
+    @pytest.mark.parametrize("mock_section_manager", [[]], indirect=True)
+    def test_preview_no_drafts(self, runner, app, fmt_mod, mock_project, mock_section_manager):
+        """Test preview when no drafts exist."""
+        with patch.multiple(
+            fmt_mod,
+            _get_project=DEFAULT,
+            SectionManager=DEFAULT
+        ) as mocks:
+            mocks['_get_project'].return_value = mock_project
+            mocks['SectionManager'].return_value = mock_section_manager
+            result = runner.invoke(app, _CMD_PREVIEW)
+            assert "no drafts" in result.output.lower()
+
+    def test_preview_latex(
+        self, runner, app, fmt_mod, mock_project, mock_section_manager, mock_citation_manager
+    ):
         """Test preview in latex format."""
-        mock_manager = Mock()
-        mock_manager.list_drafts.return_value = ['intro']
-        mock_manager.get_draft_content.return_value = "Content"
-
-        mock_citation_manager = Mock()
-        mock_citation_manager.citations = {}
-
         mock_builder = Mock()
         mock_builder.build.return_value = "\\documentclass{article}\n" * 100
 
-        with patch('papergen.cli.format._get_project', return_value=mock_project):
-            with patch('papergen.cli.format.SectionManager', return_value=mock_manager):
-                with patch('papergen.cli.format.LaTeXBuilder', return_value=mock_builder):
-                    with patch('papergen.cli.format.CitationManager') as mock_cm:
-                        mock_cm.return_value = mock_citation_manager
-                        mock_cm.load.return_value = mock_citation_manager
-
-                        with tempfile.TemporaryDirectory() as tmpdir:
-                            mock_project.get_research_dir.return_value = Path(tmpdir)
+        with patch.multiple(
+            fmt_mod,
+            _get_project=DEFAULT,
+            SectionManager=DEFAULT,
+            LaTeXBuilder=DEFAULT,
+            CitationManager=DEFAULT
+        ) as mocks:
+            mocks['_get_project'].return_value = mock_project
+            mocks['SectionManager'].return_value = mock_section_manager
+            mocks['LaTeXBuilder'].return_value = mock_builder
+            mocks['CitationManager'].return_value = mock_citation_manager
+            mocks['CitationManager'].load.return_value = mock_citation_manager
 
-                            result = runner.invoke(app, ["preview", "--format", "latex"])
-                            assert result.exit_code == 0
+            result = runner.invoke(app, _CMD_PREVIEW_LATEX)
+            assert result.exit_code == 0
 
 
 class TestStatsCommand:
     """Tests for stats command."""
 
-    def test_stats_command(self):
+    def test_stats_command(self, runner, app, fmt_mod, make_mock_project, tmp_path):
         """Test stats command."""
-        mock_project = Mock()
-        mock_project.root_path = Path("/tmp/test")
+        mock_project = make_mock_project(root=tmp_path)
 
         mock_manager = Mock()
         mock_manager.get_statistics.return_value = {
@@ -267,19 +256,21 @@ class TestStatsCommand:
             'average_words_per_section': 1000
         }
 
-        with patch('papergen.cli.format._get_project', return_value=mock_project):
-            with patch('papergen.cli.format.SectionManager', return_value=mock_manager):
-                with tempfile.TemporaryDirectory() as tmpdir:
-                    mock_project.get_output_dir.return_value = Path(tmpdir)
+        with patch.multiple(
+            fmt_mod,
+            _get_project=DEFAULT,
+            SectionManager=DEFAULT
+        ) as mocks:
+            mocks['_get_project'].return_value = mock_project
+            mocks['SectionManager'].return_value = mock_manager
 
-                    result = runner.invoke(app, ["stats"])
-                    assert result.exit_code == 0
-                    assert "5000" in result.output
+            result = runner.invoke(app, _CMD_STATS)
+            assert result.exit_code == 0
+            assert "5000" in result.output
 
-    def test_stats_with_output_files(self):
+    def test_stats_with_output_files(self, runner, app, fmt_mod, make_mock_project, tmp_path):
         """Test stats when output files exist."""
-        mock_project = Mock()
-        mock_project.root_path = Path("/tmp/test")
+        mock_project = make_mock_project(root=tmp_path)
 
         mock_manager = Mock()
         mock_manager.get_statistics.return_value = {
@@ -289,14 +280,17 @@ class TestStatsCommand:
             'average_words_per_section': 100
         }
 
-        with patch('papergen.cli.format._get_project', return_value=mock_project):
-            with patch('papergen.cli.format.SectionManager', return_value=mock_manager):
-                with tempfile.TemporaryDirectory() as tmpdir:
-                    # Create output files
-                    (Path(tmpdir) / "paper.tex").write_text("test")
-                    (Path(tmpdir) / "paper.md").write_text("test")
-                    mock_project.get_output_dir.return_value = Path(tmpdir)
-
-                    result = runner.invoke(app, ["stats"])
-                    assert result.exit_code == 0
-                    assert "latex" in result.output.lower() or "paper.tex" in result.output
+        with patch.multiple(
+            fmt_mod,
+            _get_project=DEFAULT,
+            SectionManager=DEFAULT
+        ) as mocks:
+            mocks['_get_project'].return_value = mock_project
+            mocks['SectionManager'].return_value = mock_manager
+            # Create output files
+            (tmp_path / "paper.tex").write_text("test")
+            (tmp_path / "paper.md").write_text("test")
+
+            result = runner.invoke(app, _CMD_STATS)
+            assert result.exit_code == 0
+            assert "latex" in result.output.lower() or "paper.tex" in result.output
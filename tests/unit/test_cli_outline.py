@@ -1,350 +1,332 @@
 """Tests for outline CLI commands."""
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock
-from pathlib import Path
-import tempfile
+from unittest.mock import Mock, patch
 import json
+from types import MappingProxyType, SimpleNamespace as NS
 
-from typer.testing import CliRunner
 
-from papergen.cli.outline import app, _create_basic_outline, _show_outline_preview
+_CMD_GENERATE_HELP = ("generate", "--help")
+_CMD_GENERATE = ("generate",)
+_CMD_GENERATE_NO_USE_AI = ("generate", "--no-use-ai")
+_CMD_SHOW_HELP = ("show", "--help")
+_CMD_SHOW = ("show",)
+_CMD_REFINE_HELP = ("refine", "--help")
+_CMD_REFINE_NO_INTERACTIVE = ("refine", "--no-interactive")
+_CMD_EXPORT_HELP = ("export", "--help")
+_CMD_EXPORT_MARKDOWN = ("export", "--format", "markdown")
+_CMD_EXPORT_JSON = ("export", "--format", "json")
+_CMD_EXPORT_UNKNOWN = ("export", "--format", "unknown")
+_CMD_GENERATE_SECTIONS = ("generate", "--sections", "intro,methods,results", "--no-use-ai")
 
+_SECTIONS = ("introduction", "methods", "results")
+_WORD_COUNTS = MappingProxyType({"introduction": 500, "methods": 1000, "results": 800})
 
-runner = CliRunner()
+
+@pytest.fixture
+def built_outline_mock():
+    """Outline mock used by the show and export tests."""
+    section = NS(
+        title="Introduction",
+        word_count_target=1000,
+        objectives=["Objective 1"],
+        key_points=["Point 1"],
+        guidance="Some guidance",
+        subsections=[],
+    )
+
+    outline = Mock()
+    outline.topic = "Test Topic"
+    outline.sections = [section]
+    outline.to_markdown.return_value = "# Outline\n\nContent"
+    outline.model_dump.return_value = {"topic": "Test", "sections": []}
+    return outline
+
+
+@pytest.fixture(scope="session")
+def outline_mod():
+    """The papergen.cli.outline module, imported on first use rather than at collection."""
+    from papergen.cli import outline as outline_mod
+    return outline_mod
+
+
+@pytest.fixture(scope="session")
+def app(outline_mod):
+    """The outline Typer app."""
+    return outline_mod.app
+
+
+@pytest.fixture(scope="module")
+def create_basic_outline(outline_mod):
+    """The basic-outline writer."""
+    return outline_mod._create_basic_outline
+
+
+@pytest.fixture(scope="module")
+def show_outline_preview(outline_mod):
+    """The outline preview renderer."""
+    return outline_mod._show_outline_preview
 
 
 class TestGenerateOutlineCommand:
     """Tests for generate outline command."""
 
     @pytest.fixture
-    def mock_project(self):
+    def mock_project(self, make_mock_project, tmp_path):
         """Create mock project."""
-        project = Mock()
-        project.root_path = Path("/tmp/test")
-        project.state = Mock()
-        project.state.topic = "Machine Learning"
+        project = make_mock_project(topic="Machine Learning", root=tmp_path)
         project.state.get_stage_status.return_value = Mock(value="completed")
-        project.get_research_dir.return_value = Path("/tmp/test/research")
-        project.get_outline_dir.return_value = Path("/tmp/test/outline")
-        project.save_state = Mock()
         return project
 
-    def test_generate_help(self):
+    def test_generate_help(self, runner, app):
         """Test generate command help."""
-        result = runner.invoke(app, ["generate", "--help"])
+        result = runner.invoke(app, _CMD_GENERATE_HELP)
         assert result.exit_code == 0
         assert "generate" in result.output.lower()
 
-    def test_generate_no_research(self, mock_project):
+    def test_generate_no_research(self, runner, app, outline_mod, mock_project):
         """Test generate when no research exists."""
         mock_project.state.get_stage_status.return_value = Mock(value="pending")
 
-        with patch('papergen.cli.outline._get_project', return_value=mock_project):
+        with patch.object(outline_mod, '_get_project', return_value=mock_project):
             # Non-interactive mode, should abort
-            result = runner.invoke(app, ["generate"], input="n\n")
+            result = runner.invoke(app, _CMD_GENERATE, input="n\n")
             # Should warn or exit
 
-    def test_generate_no_organized_notes(self, mock_project):
+    def test_generate_no_organized_notes(self, runner, app, outline_mod, mock_project, tmp_path):
         """Test generate when no organized notes file."""
-        with patch('papergen.cli.outline._get_project', return_value=mock_project):
-            with tempfile.TemporaryDirectory() as tmpdir:
-                mock_project.get_research_dir.return_value = Path(tmpdir)
-                # No organized_notes.md file
+        with patch.object(outline_mod, '_get_project', return_value=mock_project):
+            # No organized_notes.md file
 
-                result = runner.invoke(app, ["generate"])
-                assert result.exit_code != 0 or "error" in result.output.lower()
+            result = runner.invoke(app, _CMD_GENERATE)
+            assert result.exit_code != 0 or "error" in result.output.lower()
 
-    def test_generate_with_ai_disabled(self, mock_project):
+    def test_generate_with_ai_disabled(self, runner, app, outline_mod, mock_project, tmp_path):
         """Test generate with AI disabled."""
-        with patch('papergen.cli.outline._get_project', return_value=mock_project):
-            with tempfile.TemporaryDirectory() as tmpdir:
-                research_dir = Path(tmpdir) / "research"
-                research_dir.mkdir()
-                outline_dir = Path(tmpdir) / "outline"
-                outline_dir.mkdir()
+        with patch.object(outline_mod, '_get_project', return_value=mock_project):
+            research_dir = tmp_path / "research"
+            research_dir.mkdir()
+            outline_dir = tmp_path / "outline"
+            outline_dir.mkdir()
 
-                # Create organized notes
-                (research_dir / "organized_notes.md").write_text("# Research Notes\nContent here")
+            # Create organized notes
+            (research_dir / "organized_notes.md").write_text("# Research Notes\nContent here")
 
-                mock_project.get_research_dir.return_value = research_dir
-                mock_project.get_outline_dir.return_value = outline_dir
+            mock_project.get_research_dir.return_value = research_dir
+            mock_project.get_outline_dir.return_value = outline_dir
 
-                result = runner.invoke(app, ["generate", "--no-use-ai"])
+            result = runner.invoke(app, _CMD_GENERATE_NO_USE_AI)
 
-                # Should create basic outline
-                assert result.exit_code == 0 or "basic outline" in result.output.lower()
+            # Should create basic outline
+            assert result.exit_code == 0 or "basic outline" in result.output.lower()
 
-    def test_generate_with_custom_sections(self, mock_project):
+    def test_generate_with_custom_sections(self, runner, app, outline_mod, mock_project, tmp_path):
         """Test generate with custom sections."""
-        with patch('papergen.cli.outline._get_project', return_value=mock_project):
-            with tempfile.TemporaryDirectory() as tmpdir:
-                research_dir = Path(tmpdir) / "research"
-                research_dir.mkdir()
-                outline_dir = Path(tmpdir) / "outline"
-                outline_dir.mkdir()
+        with patch.object(outline_mod, '_get_project', return_value=mock_project):
+            research_dir = tmp_path / "research"
+            research_dir.mkdir()
+            outline_dir = tmp_path / "outline"
+            outline_dir.mkdir()
 
-                (research_dir / "organized_notes.md").write_text("# Research Notes")
+            (research_dir / "organized_notes.md").write_text("# Research Notes")
 
-                mock_project.get_research_dir.return_value = research_dir
-                mock_project.get_outline_dir.return_value = outline_dir
+            mock_project.get_research_dir.return_value = research_dir
+            mock_project.get_outline_dir.return_value = outline_dir
 
-                result = runner.invoke(app, [
-                    "generate",
-                    "--sections", "intro,methods,results",
-                    "--no-use-ai"
-                ])
+            result = runner.invoke(app, _CMD_GENERATE_SECTIONS)
 
-                # Should process custom sections
+            # Should process custom sections
 
 
 class TestShowOutlineCommand:
     """Tests for show outline command."""
 
     @pytest.fixture
-    def mock_project(self):
+    def mock_project(self, make_mock_project, tmp_path):
         """Create mock project."""
-        project = Mock()
-        project.get_outline_dir.return_value = Path("/tmp/test/outline")
-        return project
+        return make_mock_project(root=tmp_path)
 
-    def test_show_help(self):
+    def test_show_help(self, runner, app):
         """Test show command help."""
-        result = runner.invoke(app, ["show", "--help"])
+        result = runner.invoke(app, _CMD_SHOW_HELP)
         assert result.exit_code == 0
         assert "show" in result.output.lower()
 
-    def test_show_no_outline(self, mock_project):
-        """Test show when no outline exists."""
-        with patch('papergen.cli.outline._get_project', return_value=mock_project):
-            with tempfile.TemporaryDirectory() as tmpdir:
-                mock_project.get_outline_dir.return_value = Path(tmpdir)
-
-                result = runner.invoke(app, ["show"])
-                assert "no outline" in result.output.lower()
-
-    def test_show_with_outline(self, mock_project):
+    def test_show_with_outline(
+        self, runner, app, outline_mod, mock_project, built_outline_mock, tmp_path
+    ):
         """Test show with existing outline."""
-        mock_outline = Mock()
-        mock_outline.topic = "Test Topic"
-        mock_section = Mock()
-        mock_section.title = "Introduction"
-        mock_section.word_count_target = 1000
-        mock_section.objectives = ["Objective 1"]
-        mock_section.key_points = ["Point 1"]
-        mock_section.guidance = "Some guidance"
-        mock_section.subsections = []
-        mock_outline.sections = [mock_section]
-
-        with patch('papergen.cli.outline._get_project', return_value=mock_project):
-            with patch('papergen.cli.outline.Outline') as MockOutline:
-                MockOutline.from_json_file.return_value = mock_outline
+        with patch.object(outline_mod, '_get_project', return_value=mock_project):
+            with patch.object(outline_mod, 'Outline') as MockOutline:
+                MockOutline.from_json_file.return_value = built_outline_mock
 
-                with tempfile.TemporaryDirectory() as tmpdir:
-                    outline_dir = Path(tmpdir)
-                    (outline_dir / "outline.json").write_text("{}")
-                    mock_project.get_outline_dir.return_value = outline_dir
+                (tmp_path / "outline.json").write_text("{}")
 
-                    result = runner.invoke(app, ["show"])
-                    # Should display outline
+                result = runner.invoke(app, _CMD_SHOW)
+                # Should display outline
 
 
 class TestRefineOutlineCommand:
     """Tests for refine outline command."""
 
     @pytest.fixture
-    def mock_project(self):
+    def mock_project(self, make_mock_project, tmp_path):
         """Create mock project."""
-        project = Mock()
-        project.get_outline_dir.return_value = Path("/tmp/test/outline")
-        project.get_research_dir.return_value = Path("/tmp/test/research")
-        return project
+        return make_mock_project(root=tmp_path)
 
-    def test_refine_help(self):
+    def test_refine_help(self, runner, app):
         """Test refine command help."""
-        result = runner.invoke(app, ["refine", "--help"])
+        result = runner.invoke(app, _CMD_REFINE_HELP)
         assert result.exit_code == 0
         assert "refine" in result.output.lower()
 
-    def test_refine_no_outline(self, mock_project):
-        """Test refine when no outline exists."""
-        with patch('papergen.cli.outline._get_project', return_value=mock_project):
-            with tempfile.TemporaryDirectory() as tmpdir:
-                mock_project.get_outline_dir.return_value = Path(tmpdir)
-
-                result = runner.invoke(app, ["refine"])
-                assert "no outline" in result.output.lower()
-
-    def test_refine_non_interactive(self, mock_project):
+    def test_refine_non_interactive(self, runner, app, outline_mod, mock_project, tmp_path):
         """Test refine in non-interactive mode."""
         mock_outline = Mock()
         mock_outline.sections = []
 
-        with patch('papergen.cli.outline._get_project', return_value=mock_project):
-            with patch('papergen.cli.outline.Outline') as MockOutline:
+        with patch.object(outline_mod, '_get_project', return_value=mock_project):
+            with patch.object(outline_mod, 'Outline') as MockOutline:
                 MockOutline.from_json_file.return_value = mock_outline
 
-                with tempfile.TemporaryDirectory() as tmpdir:
-                    outline_dir = Path(tmpdir)
-                    (outline_dir / "outline.json").write_text("{}")
-                    mock_project.get_outline_dir.return_value = outline_dir
+                (tmp_path / "outline.json").write_text("{}")
 
-                    result = runner.invoke(app, ["refine", "--no-interactive"])
-                    assert "not yet implemented" in result.output.lower()
+                result = runner.invoke(app, _CMD_REFINE_NO_INTERACTIVE)
+                assert "not yet implemented" in result.output.lower()
 
 
 class TestExportOutlineCommand:
     """Tests for export outline command."""
 
     @pytest.fixture
-    def mock_project(self):
+    def mock_project(self, make_mock_project, tmp_path):
         """Create mock project."""
-        project = Mock()
-        project.get_outline_dir.return_value = Path("/tmp/test/outline")
-        return project
+        return make_mock_project(root=tmp_path)
 
-    def test_export_help(self):
+    def test_export_help(self, runner, app):
         """Test export command help."""
-        result = runner.invoke(app, ["export", "--help"])
+        result = runner.invoke(app, _CMD_EXPORT_HELP)
         assert result.exit_code == 0
         assert "export" in result.output.lower()
 
-    def test_export_no_outline(self, mock_project):
-        """Test export when no outline exists."""
-        with patch('papergen.cli.outline._get_project', return_value=mock_project):
-            with tempfile.TemporaryDirectory() as tmpdir:
-                mock_project.get_outline_dir.return_value = Path(tmpdir)
-
-                result = runner.invoke(app, ["export"])
-                assert "no outline" in result.output.lower()
-
-    def test_export_markdown(self, mock_project):
+    def test_export_markdown(
+        self, runner, app, outline_mod, mock_project, built_outline_mock, tmp_path
+    ):
         """Test export to markdown."""
-        mock_outline = Mock()
-        mock_outline.to_markdown.return_value = "# Outline\n\nContent"
-
-        with patch('papergen.cli.outline._get_project', return_value=mock_project):
-            with patch('papergen.cli.outline.Outline') as MockOutline:
-                MockOutline.from_json_file.return_value = mock_outline
+        with patch.object(outline_mod, '_get_project', return_value=mock_project):
+            with patch.object(outline_mod, 'Outline') as MockOutline:
+                MockOutline.from_json_file.return_value = built_outline_mock
 
-                with tempfile.TemporaryDirectory() as tmpdir:
-                    outline_dir = Path(tmpdir)
-                    (outline_dir / "outline.json").write_text("{}")
-                    mock_project.get_outline_dir.return_value = outline_dir
+                (tmp_path / "outline.json").write_text("{}")
 
-                    result = runner.invoke(app, ["export", "--format", "markdown"])
-                    # Should output markdown
+                result = runner.invoke(app, _CMD_EXPORT_MARKDOWN)
+                # Should output markdown
 
-    def test_export_json(self, mock_project):
+    def test_export_json(
+        self, runner, app, outline_mod, mock_project, built_outline_mock, tmp_path
+    ):
         """Test export to JSON."""
-        mock_outline = Mock()
-        mock_outline.model_dump.return_value = {"topic": "Test", "sections": []}
+        with patch.object(outline_mod, '_get_project', return_value=mock_project):
+            with patch.object(outline_mod, 'Outline') as MockOutline:
+                MockOutline.from_json_file.return_value = built_outline_mock
 
-        with patch('papergen.cli.outline._get_project', return_value=mock_project):
-            with patch('papergen.cli.outline.Outline') as MockOutline:
-                MockOutline.from_json_file.return_value = mock_outline
+                (tmp_path / "outline.json").write_text("{}")
 
-                with tempfile.TemporaryDirectory() as tmpdir:
-                    outline_dir = Path(tmpdir)
-                    (outline_dir / "outline.json").write_text("{}")
-                    mock_project.get_outline_dir.return_value = outline_dir
+                result = runner.invoke(app, _CMD_EXPORT_JSON)
+                # Should output JSON
 
-                    result = runner.invoke(app, ["export", "--format", "json"])
-                    # Should output JSON
-
-    def test_export_unknown_format(self, mock_project):
+    def test_export_unknown_format(
+        self, runner, app, outline_mod, mock_project, built_outline_mock, tmp_path
+    ):
         """Test export with unknown format."""
-        mock_outline = Mock()
+        with patch.object(outline_mod, '_get_project', return_value=mock_project):
+            with patch.object(outline_mod, 'Outline') as MockOutline:
+                MockOutline.from_json_file.return_value = built_outline_mock
+
+                (tmp_path / "outline.json").write_text("{}")
+
+                result = runner.invoke(app, _CMD_EXPORT_UNKNOWN)
+                assert "unknown format" in result.output.lower()
 
-        with patch('papergen.cli.outline._get_project', return_value=mock_project):
-            with patch('papergen.cli.outline.Outline') as MockOutline:
-                MockOutline.from_json_file.return_value = mock_outline
 
-                with tempfile.TemporaryDirectory() as tmpdir:
-                    outline_dir = Path(tmpdir)
-                    (outline_dir / "outline.json").write_text("{}")
-                    mock_project.get_outline_dir.return_value = outline_dir
+class TestNoOutline:
+    """Tests for outline commands run before an outline exists."""
 
-                    result = runner.invoke(app, ["export", "--format", "unknown"])
-                    assert "unknown format" in result.output.lower()
+    @pytest.mark.parametrize("cmd", ["show", "refine", "export"])
+    def test_no_outline(self, runner, app, outline_mod, make_mock_project, tmp_path, cmd):
+        """Test each command reports a missing outline."""
+        mock_project = make_mock_project(root=tmp_path)
+        with patch.object(outline_mod, '_get_project', return_value=mock_project):
+            result = runner.invoke(app, (cmd,))
+            assert "no outline" in result.output.lower()
 
 
 class TestCreateBasicOutline:
     """Tests for _create_basic_outline function."""
 
-    def test_create_basic_outline(self):
+    def test_create_basic_outline(self, create_basic_outline, make_mock_project, tmp_path):
         """Test creating basic outline."""
-        mock_project = Mock()
-        mock_project.state = Mock()
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            outline_dir = Path(tmpdir)
-            mock_project.get_outline_dir.return_value = outline_dir
+        mock_project = make_mock_project(root=tmp_path)
 
-            _create_basic_outline(
-                project=mock_project,
-                topic="Test Topic",
-                sections=["introduction", "methods", "results"],
-                word_counts={"introduction": 500, "methods": 1000, "results": 800}
-            )
+        create_basic_outline(
+            project=mock_project,
+            topic="Test Topic",
+            sections=_SECTIONS,
+            word_counts=_WORD_COUNTS
+        )
 
-            # Check files were created
-            assert (outline_dir / "outline.json").exists()
-            assert (outline_dir / "outline.md").exists()
+        # Check files were created
+        assert (tmp_path / "outline.json").exists()
+        assert (tmp_path / "outline.md").exists()
 
-            # Check state was updated
-            mock_project.state.mark_stage_completed.assert_called_with("outline")
-            mock_project.save_state.assert_called_once()
+        # Check state was updated
+        mock_project.state.mark_stage_completed.assert_called_with("outline")
+        mock_project.save_state.assert_called_once()
 
 
 class TestShowOutlinePreview:
     """Tests for _show_outline_preview function."""
 
-    def test_show_preview(self, capsys):
+    def test_show_preview(self, show_outline_preview, capsys):
         """Test showing outline preview."""
-        mock_section = Mock()
-        mock_section.title = "Introduction"
-        mock_section.word_count_target = 1000
-        mock_section.objectives = ["Explain problem", "Present motivation"]
-        mock_section.key_points = ["Point 1", "Point 2", "Point 3", "Point 4"]
-        mock_section.subsections = []
-
-        mock_outline = Mock()
-        mock_outline.sections = [mock_section]
-
-        _show_outline_preview(mock_outline)
+        mock_section = NS(
+            title="Introduction",
+            word_count_target=1000,
+            objectives=["Explain problem", "Present motivation"],
+            key_points=["Point 1", "Point 2", "Point 3", "Point 4"],
+            subsections=[],
+        )
+        mock_outline = NS(sections=[mock_section])
+
+        show_outline_preview(mock_outline)
         # Should not raise error
 
-    def test_show_preview_with_subsections(self, capsys):
+    def test_show_preview_with_subsections(self, show_outline_preview, capsys):
         """Test showing preview with subsections."""
-        mock_subsection = Mock()
-        mock_subsection.title = "Subsection 1"
-
-        mock_section = Mock()
-        mock_section.title = "Introduction"
-        mock_section.word_count_target = 1000
-        mock_section.objectives = []
-        mock_section.key_points = []
-        mock_section.subsections = [mock_subsection, mock_subsection]
-
-        mock_outline = Mock()
-        mock_outline.sections = [mock_section]
-
-        _show_outline_preview(mock_outline)
+        mock_subsection = NS(title="Subsection 1")
+        mock_section = NS(
+            title="Introduction",
+            word_count_target=1000,
+            objectives=[],
+            key_points=[],
+            subsections=[mock_subsection, mock_subsection],
+        )
+        mock_outline = NS(sections=[mock_section])
+
+        show_outline_preview(mock_outline)
         # Should not raise error
 
 
 class TestGetProject:
     """Tests for _get_project function."""
 
-    def test_get_project_delegates(self):
+    def test_get_project_delegates(self, outline_mod):
         """Test that _get_project delegates to main module."""
         mock_project = Mock()
 
-        with patch('papergen.cli.outline._get_project') as mock_get:
+        with patch.object(outline_mod, '_get_project') as mock_get:
             mock_get.return_value = mock_project
 
-            from papergen.cli.outline import _get_project
-            result = _get_project()
+            result = outline_mod._get_project()
 
             # Should return the project
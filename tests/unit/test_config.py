@@ -4,34 +4,52 @@ import pytest
 from unittest.mock import patch, mock_open, Mock
 from pathlib import Path
 import os
+import sys
 
 from papergen.core.config import Config
 
 
+@pytest.fixture(autouse=True)
+def _reset_config(monkeypatch):
+    """Give each test a fresh Config that skips file loading; restore the singleton after."""
+    monkeypatch.setattr(Config, '_instance', None)
+    monkeypatch.setattr('papergen.core.config.load_dotenv', Mock())
+    monkeypatch.setattr(Config, '_load_config', lambda self: None)
+
+
 class TestConfigSingleton:
     """Tests for Config singleton pattern."""
 
     def test_singleton_returns_same_instance(self):
         """Test that Config is a singleton."""
-        # Reset singleton for test
-        Config._instance = None
-
-        with patch.object(Config, '_load_config'):
-            config1 = Config()
-            config2 = Config()
+        config1 = Config()
+        config2 = Config()
 
         assert config1 is config2
 
     def test_singleton_initializes_once(self):
         """Test that _load_config is only called once."""
-        Config._instance = None
+        with patch.object(Config, '_load_config') as mock_load:
+            Config().get('api.model')
+            Config().get('api.model')
+            Config().set('api.model', 'claude-opus')
 
+        assert mock_load.call_count == 1
+
+    def test_construction_defers_loading(self):
+        """Test that constructing Config does not read configuration files."""
         with patch.object(Config, '_load_config') as mock_load:
             Config()
+
+        mock_load.assert_not_called()
+
+    def test_construction_loads_dotenv(self):
+        """Test that .env is applied when the instance is created, before any lookup."""
+        with patch('papergen.core.config.load_dotenv') as mock_dotenv:
             Config()
             Config()
 
-        assert mock_load.call_count == 1
+        mock_dotenv.assert_called_once_with()
 
 
 class TestConfigGet:
@@ -40,23 +58,20 @@ class TestConfigGet:
     @pytest.fixture
     def config(self):
         """Create a config instance with test data."""
-        Config._instance = None
-
-        with patch.object(Config, '_load_config'):
-            conf = Config()
-            conf._config = {
-                'api': {
-                    'model': 'claude-sonnet-4-5',
-                    'temperature': 0.7,
-                    'nested': {
-                        'deep_value': 'found'
-                    }
-                },
-                'content': {
-                    'citation_style': 'apa'
+        conf = Config()
+        conf._config = {
+            'api': {
+                'model': 'claude-sonnet-4-5',
+                'temperature': 0.7,
+                'nested': {
+                    'deep_value': 'found'
                 }
+            },
+            'content': {
+                'citation_style': 'apa'
             }
-            yield conf
+        }
+        return conf
 
     def test_get_simple_key(self, config):
         """Test getting a top-level key."""
@@ -85,6 +100,36 @@ class TestConfigGet:
         assert config.get('nonexistent') is None
         assert config.get('api.nonexistent.deep') is None
 
+    def test_get_flat_none_value_returns_default(self, config):
+        """Test that a top-level None value falls back to the default."""
+        config._config['empty'] = None
+        assert config.get('empty', 'default') == 'default'
+
+    def test_get_nested_none_value_returns_default(self, config):
+        """Test that a nested None value falls back to the default."""
+        config._config['api']['unset'] = None
+        assert config.get('api.unset', 'default') == 'default'
+
+    def test_get_through_scalar_returns_default(self, config):
+        """Test that walking past a scalar value returns the default."""
+        assert config.get('api.model.name', 'default') == 'default'
+
+    @pytest.mark.parametrize("key, expected", [
+        pytest.param('api', ('api',), id="single"),
+        pytest.param('api.model', ('api', 'model'), id="nested"),
+        pytest.param('a.b.c.d', ('a', 'b', 'c', 'd'), id="deep"),
+    ])
+    def test_split_key(self, key, expected):
+        """Test that keys split on every dot."""
+        assert Config._split_key(key) == expected
+
+    def test_split_key_is_cached(self):
+        """Test that dotted keys are split once and reused."""
+        parts = Config._split_key('api.nested.deep_value')
+
+        assert parts == ('api', 'nested', 'deep_value')
+        assert Config._split_key('api.nested.deep_value') is parts
+
 
 class TestConfigSet:
     """Tests for Config.set method."""
@@ -92,12 +137,9 @@ class TestConfigSet:
     @pytest.fixture
     def config(self):
         """Create a fresh config instance."""
-        Config._instance = None
-
-        with patch.object(Config, '_load_config'):
-            conf = Config()
-            conf._config = {}
-            yield conf
+        conf = Config()
+        conf._config = {}
+        return conf
 
     def test_set_simple_key(self, config):
         """Test setting a simple key."""
@@ -123,6 +165,31 @@ class TestConfigSet:
 
         assert config.get('key') == 'updated'
 
+    def test_set_nested_replaces_scalar_parent(self, config):
+        """Test that a scalar on the path is replaced by a nested section."""
+        config.set('api', 'disabled')
+        config.set('api.model', 'claude-sonnet')
+
+        assert config._config['api'] == {'model': 'claude-sonnet'}
+
+    def test_set_nested_after_get_is_visible(self, config):
+        """Test that a nested leaf set after a read is returned by get."""
+        config.set('api.model', 'claude-sonnet')
+        assert config.get('api.model') == 'claude-sonnet'
+
+        config.set('api.model', 'claude-opus')
+        assert config.get('api.model') == 'claude-opus'
+
+    def test_set_replaces_subtree(self, config):
+        """Test that replacing a subtree drops its old leaves."""
+        config.set('api.model', 'claude-sonnet')
+        assert config.get('api.model') == 'claude-sonnet'
+
+        config.set('api', 'disabled')
+
+        assert config.get('api') == 'disabled'
+        assert config.get('api.model', 'default') == 'default'
+
 
 class TestConfigApiKey:
     """Tests for Config.get_api_key method."""
@@ -130,10 +197,7 @@ class TestConfigApiKey:
     @pytest.fixture
     def config(self):
         """Create a config instance."""
-        Config._instance = None
-
-        with patch.object(Config, '_load_config'):
-            yield Config()
+        return Config()
 
     def test_get_api_key_from_anthropic_api_key(self, config):
         """Test getting API key from ANTHROPIC_API_KEY env var."""
@@ -165,6 +229,15 @@ class TestConfigApiKey:
 
             assert "ANTHROPIC_API_KEY" in str(exc_info.value)
 
+    def test_get_api_key_sees_later_env_changes(self, config):
+        """Test that a key exported after the first lookup is picked up."""
+        with patch.dict(os.environ, {}, clear=True):
+            with pytest.raises(ValueError):
+                config.get_api_key()
+
+            os.environ['ANTHROPIC_API_KEY'] = 'late-key'
+            assert config.get_api_key() == 'late-key'
+
 
 class TestConfigBaseUrl:
     """Tests for Config.get_api_base_url method."""
@@ -172,12 +245,9 @@ class TestConfigBaseUrl:
     @pytest.fixture
     def config(self):
         """Create a config instance."""
-        Config._instance = None
-
-        with patch.object(Config, '_load_config'):
-            conf = Config()
-            conf._config = {}
-            yield conf
+        conf = Config()
+        conf._config = {}
+        return conf
 
     def test_get_base_url_from_env(self, config):
         """Test getting base URL from environment variable."""
@@ -212,20 +282,17 @@ class TestConfigApiConfig:
     @pytest.fixture
     def config(self):
         """Create a config instance with API settings."""
-        Config._instance = None
-
-        with patch.object(Config, '_load_config'):
-            conf = Config()
-            conf._config = {
-                'api': {
-                    'provider': 'anthropic',
-                    'model': 'claude-sonnet-4-5',
-                    'max_tokens': 8192,
-                    'temperature': 0.5,
-                    'timeout': 300
-                }
+        conf = Config()
+        conf._config = {
+            'api': {
+                'provider': 'anthropic',
+                'model': 'claude-sonnet-4-5',
+                'max_tokens': 8192,
+                'temperature': 0.5,
+                'timeout': 300
             }
-            yield conf
+        }
+        return conf
 
     def test_get_api_config_returns_all_settings(self, config):
         """Test that get_api_config returns all API settings."""
@@ -247,23 +314,56 @@ class TestConfigApiConfig:
 
             assert api_config['base_url'] == 'https://proxy.example.com'
 
+    def test_get_api_config_reads_api_section_once(self, config):
+        """Test that settings come from one api-section lookup, not a dotted walk each."""
+        with patch.dict(os.environ, {}, clear=True), \
+                patch.object(Config, '_split_key') as split_key:
+            api_config = config.get_api_config()
+
+        split_key.assert_not_called()
+        assert api_config['model'] == 'claude-sonnet-4-5'
+
+    def test_get_api_config_sees_in_place_changes(self, config):
+        """Test that edits made directly to the config tree show up in the API config."""
+        with patch.dict(os.environ, {}, clear=True):
+            config.get_api_config()
+            config._config['api']['model'] = 'claude-haiku-4-5'
+            assert config.get_api_config()['model'] == 'claude-haiku-4-5'
+
+            config._config = {'api': {'timeout': 60}}
+            assert config.get_api_config()['timeout'] == 60
+
+    def test_get_api_config_none_values_use_defaults(self, config):
+        """Test that settings stored as None fall back to their defaults."""
+        config._config = {'api': {'model': None, 'timeout': None}}
+
+        with patch.dict(os.environ, {}, clear=True):
+            api_config = config.get_api_config()
+
+        assert api_config['model'] == 'claude-opus-4-5'
+        assert api_config['timeout'] == 120
+
+    def test_get_api_config_returns_copy(self, config):
+        """Test that mutating the returned dict does not affect later calls."""
+        with patch.dict(os.environ, {}, clear=True):
+            config.get_api_config()['model'] = 'changed'
+
+            assert config.get_api_config()['model'] == 'claude-sonnet-4-5'
+
     def test_get_api_config_uses_defaults(self):
         """Test that defaults are used when config is empty."""
-        Config._instance = None
-
-        with patch.object(Config, '_load_config'):
-            config = Config()
-            config._config = {}
+        config = Config()
+        config._config = {}
 
-            with patch.dict(os.environ, {}, clear=True):
-                os.environ.pop('ANTHROPIC_BASE_URL', None)
+        with patch.dict(os.environ, {}, clear=True):
+            os.environ.pop('ANTHROPIC_BASE_URL', None)
 
-                api_config = config.get_api_config()
+            api_config = config.get_api_config()
 
-                assert api_config['provider'] == 'anthropic'
-                assert api_config['model'] == 'claude-opus-4-5'
-                assert api_config['max_tokens'] == 4096
-                assert api_config['temperature'] == 0.7
+            assert api_config['provider'] == 'anthropic'
+            assert api_config['model'] == 'claude-opus-4-5'
+            assert api_config['max_tokens'] == 4096
+            assert api_config['temperature'] == 0.7
 
 
 class TestConfigWordCounts:
@@ -272,12 +372,9 @@ class TestConfigWordCounts:
     @pytest.fixture
     def config(self):
         """Create a config instance."""
-        Config._instance = None
-
-        with patch.object(Config, '_load_config'):
-            conf = Config()
-            conf._config = {}
-            yield conf
+        conf = Config()
+        conf._config = {}
+        return conf
 
     def test_get_word_count_targets_returns_defaults(self, config):
         """Test that default word counts are returned."""
@@ -313,12 +410,9 @@ class TestConfigCitationStyle:
     @pytest.fixture
     def config(self):
         """Create a config instance."""
-        Config._instance = None
-
-        with patch.object(Config, '_load_config'):
-            conf = Config()
-            conf._config = {}
-            yield conf
+        conf = Config()
+        conf._config = {}
+        return conf
 
     def test_get_citation_style_default(self, config):
         """Test default citation style."""
@@ -337,15 +431,12 @@ class TestConfigProjectConfig:
     @pytest.fixture
     def config(self):
         """Create a config instance."""
-        Config._instance = None
-
-        with patch.object(Config, '_load_config'):
-            conf = Config()
-            conf._config = {
-                'api': {'model': 'claude-sonnet'},
-                'content': {'citation_style': 'apa'}
-            }
-            yield conf
+        conf = Config()
+        conf._config = {
+            'api': {'model': 'claude-sonnet'},
+            'content': {'citation_style': 'apa'}
+        }
+        return conf
 
     def test_load_project_config_merges(self, config, tmp_path):
         """Test that project config is merged with base config."""
@@ -361,6 +452,18 @@ class TestConfigProjectConfig:
         assert config.get('api.model') == 'claude-opus'
         assert config.get('content.citation_style') == 'chicago'
 
+    def test_load_project_config_interns_keys(self, config, tmp_path):
+        """Test that keys read from YAML are interned."""
+        project_config_dir = tmp_path / ".papergen"
+        project_config_dir.mkdir()
+        (project_config_dir / "config.yaml").write_text("output:\n  build_directory: out\n")
+
+        config.load_project_config(tmp_path)
+
+        output_key = next(key for key in config._config if key == 'output')
+        assert output_key is sys.intern('output')
+        assert next(iter(config._config['output'])) is sys.intern('build_directory')
+
     def test_load_project_config_missing_file(self, config, tmp_path):
         """Test that missing project config is handled."""
         # Should not raise, just do nothing
@@ -376,10 +479,7 @@ class TestConfigMerge:
     @pytest.fixture
     def config(self):
         """Create a config instance."""
-        Config._instance = None
-
-        with patch.object(Config, '_load_config'):
-            yield Config()
+        return Config()
 
     def test_merge_overwrites_simple_values(self, config):
         """Test that simple values are overwritten."""
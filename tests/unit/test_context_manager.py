@@ -1,6 +1,7 @@
 """Tests for ContextManager."""
 
 import pytest
+from unittest.mock import patch
 
 from papergen.ai.context_manager import ContextManager, ContextComponent
 
@@ -31,6 +32,12 @@ class TestContextComponent:
         assert component.token_estimate == 500
         assert component.label == "important"
 
+    def test_uses_slots(self):
+        """Test that components carry no per-instance __dict__."""
+        component = ContextComponent(content="Test content")
+
+        assert not hasattr(component, "__dict__")
+
 
 class TestContextManagerInit:
     """Tests for ContextManager initialization."""
@@ -99,6 +106,18 @@ class TestContextManagerBuildContext:
         assert "Medium priority" in result
         assert "Low priority" in result
 
+    def test_joins_components_in_priority_order(self, manager):
+        """Test that included components are joined once, highest priority first."""
+        components = [
+            ContextComponent(content="Low", priority=1),
+            ContextComponent(content="High", priority=10),
+            ContextComponent(content="Medium", priority=5)
+        ]
+
+        result = manager.build_context(components)
+
+        assert result == "High\n\n---\n\nMedium\n\n---\n\nLow"
+
     def test_required_components(self, manager):
         """Test that required components are always included."""
         components = [
@@ -121,6 +140,16 @@ class TestContextManagerBuildContext:
         # Token estimate should be set after building
         assert component.token_estimate > 0
 
+    def test_token_estimate_reused_across_builds(self, manager):
+        """Test that a component's estimate is computed once and then reused."""
+        component = ContextComponent(content="Test content")
+
+        with patch.object(manager, '_estimate_tokens', wraps=manager._estimate_tokens) as estimate:
+            manager.build_context([component])
+            manager.build_context([component])
+
+        estimate.assert_called_once_with("Test content")
+
     def test_truncation_when_exceeding_max_tokens(self):
         """Test truncation when content exceeds max tokens."""
         # Use a small max_tokens to force truncation
@@ -194,6 +223,36 @@ class TestContextManagerPrioritizeSources:
 
         assert len(result) == 2
 
+    def test_query_matches_whole_title_words(self, manager):
+        """Test that title terms must match whole words, case-insensitively."""
+        sources = [
+            {"id": "partial", "metadata": {"title": "Learnings from C++"}, "content": {}},
+            {"id": "whole", "metadata": {"title": "Learning in C++"}, "content": {}},
+        ]
+
+        result = manager.prioritize_sources(sources, query="LEARNING c++", max_sources=10)
+
+        assert [source["id"] for source in result] == ["whole", "partial"]
+
+    def test_blank_query_keeps_order(self, manager):
+        """Test that a whitespace-only query does not reorder sources."""
+        sources = [{"id": i, "metadata": {"title": "Paper"}} for i in range(3)]
+
+        result = manager.prioritize_sources(sources, query="   ", max_sources=10)
+
+        assert [source["id"] for source in result] == [0, 1, 2]
+
+    def test_top_sources_ties_keep_input_order(self, manager):
+        """Test that the top sources are ranked by score, ties in input order."""
+        sources = [
+            {"id": i, "metadata": {"title": "neural" if i % 10 == 0 else "other"}}
+            for i in range(100)
+        ]
+
+        result = manager.prioritize_sources(sources, query="neural", max_sources=5)
+
+        assert [source["id"] for source in result] == [0, 10, 20, 30, 40]
+
     def test_max_sources_limit(self, manager):
         """Test max_sources limit."""
         sources = [{"id": i} for i in range(100)]
@@ -239,6 +298,22 @@ class TestContextManagerChunkContent:
         for chunk in result:
             assert chunk.strip() != ""
 
+    def test_packs_whole_paragraphs(self, manager):
+        """Test that paragraphs are packed whole until a chunk would overflow."""
+        content = "\n\n".join(["a" * 10, "b" * 10, "c" * 10])
+
+        result = manager.chunk_large_content(content, chunk_size=6)
+
+        assert result == ["a" * 10 + "\n\n" + "b" * 10, "c" * 10]
+
+    def test_splits_oversized_paragraph(self, manager):
+        """Test that a paragraph longer than a chunk is cut at the size limit."""
+        content = "x" * 50 + "\n\nshort"
+
+        result = manager.chunk_large_content(content, chunk_size=5)
+
+        assert result == ["x" * 20, "x" * 20, "x" * 10 + "\n\nshort"]
+
 
 class TestContextManagerSummarize:
     """Tests for summarize_for_context method."""
@@ -301,6 +376,23 @@ class TestContextManagerPrivateMethods:
         # 50 tokens * 4 chars = 200 chars
         assert len(result) < 300  # Including truncation message
 
+    def test_truncate_includes_marker_in_budget(self, manager):
+        """Test that truncated text, marker included, fits the character budget."""
+        text = "x" * 1000
+
+        result = manager._truncate_to_tokens(text, max_tokens=50)
+
+        assert len(result) == 200
+        assert result.endswith("[... truncated ...]")
+
+    def test_truncate_budget_smaller_than_marker(self, manager):
+        """Test that a budget too small for the marker still yields at most max_tokens * 4 chars."""
+        text = "x" * 1000
+
+        result = manager._truncate_to_tokens(text, max_tokens=1)
+
+        assert result == "xxxx"
+
     def test_truncate_small_text(self, manager):
         """Test truncation doesn't affect small text."""
         text = "small"
@@ -308,3 +400,19 @@ class TestContextManagerPrivateMethods:
         result = manager._truncate_to_tokens(text, max_tokens=1000)
 
         assert result == text
+
+    @pytest.mark.parametrize("budget, expected", [
+        pytest.param(0, (0, 0), id="nothing-fits"),
+        pytest.param(250, (2, 250), id="exact-fit"),
+        pytest.param(300, (2, 250), id="partial"),
+        pytest.param(1000, (3, 550), id="all-fit"),
+    ])
+    def test_fit_prefix(self, manager, budget, expected):
+        """Test counting the leading components that fit a budget."""
+        components = [
+            ContextComponent(content="a", token_estimate=100),
+            ContextComponent(content="b", token_estimate=150),
+            ContextComponent(content="c", token_estimate=300),
+        ]
+
+        assert manager._fit_prefix(components, budget) == expected
@@ -10,14 +10,130 @@ from papergen.core.exceptions import (
     APIRateLimitError,
     APIConnectionError,
     APITimeoutError,
+    APIResponseError,
     PDFExtractionError,
     WebExtractionError,
     EmptyContentError,
     InvalidConfigError,
+    MissingConfigError,
+    APIKeyNotFoundError,
+    SourceNotFoundError,
+    DuplicateSourceError,
+    OutlineError,
+    DraftError,
+    RevisionError,
+    FormattingError,
+    InvalidCitationError,
+    CitationNotFoundError,
+    InvalidInputError,
+    FileValidationError,
+    PaperSearchError,
+    PaperNotFoundError,
     map_http_status_to_exception
 )
 
 
+# (exception class, constructor args, expected attributes, substrings of str(exc),
+#  substrings of str(exc).lower())
+_EXCEPTION_CASES = [
+    pytest.param(
+        ProjectNotFoundError, ("/path/to/project",), {"path": "/path/to/project"},
+        ["/path/to/project"], ["project", "found"], id="project-not-found"),
+    pytest.param(
+        ProjectAlreadyExistsError, ("/existing/project",), {"path": "/existing/project"},
+        ["/existing/project"], ["already exists"], id="project-already-exists"),
+    pytest.param(
+        ProjectStateError, ("State file corrupted",), {},
+        ["State file corrupted"], [], id="project-state"),
+    pytest.param(
+        APIAuthenticationError, ("Claude",), {"provider": "Claude"},
+        ["Claude"], ["authentication", "api key"], id="api-authentication"),
+    pytest.param(
+        APIRateLimitError, ("Claude", 60), {"provider": "Claude", "retry_after": 60},
+        ["Claude", "60"], [], id="api-rate-limit"),
+    pytest.param(
+        APIRateLimitError, ("Claude",), {"retry_after": None},
+        [], ["rate limit"], id="api-rate-limit-without-retry"),
+    pytest.param(
+        APIConnectionError, ("Claude", "Connection timeout"), {"provider": "Claude"},
+        ["Claude", "Connection timeout"], [], id="api-connection"),
+    pytest.param(
+        APITimeoutError, ("Claude", 30), {"provider": "Claude", "timeout": 30},
+        ["30"], [], id="api-timeout"),
+    pytest.param(
+        APIResponseError, ("Claude", 404, "Not found"),
+        {"provider": "Claude", "status_code": 404, "message": "Not found"},
+        ["404"], [], id="api-response"),
+    pytest.param(
+        PDFExtractionError, ("/path/to/paper.pdf", "File is corrupted"),
+        {"file_path": "/path/to/paper.pdf", "reason": "File is corrupted"},
+        ["/path/to/paper.pdf", "File is corrupted"], [], id="pdf-extraction"),
+    pytest.param(
+        WebExtractionError, ("https://example.com/paper", "404 Not Found"),
+        {"url": "https://example.com/paper", "reason": "404 Not Found"},
+        ["https://example.com/paper", "404 Not Found"], [], id="web-extraction"),
+    pytest.param(
+        EmptyContentError, ("paper.pdf", 100), {"source": "paper.pdf", "min_length": 100},
+        ["paper.pdf", "100"], [], id="empty-content"),
+    pytest.param(
+        EmptyContentError, ("paper.pdf",), {"min_length": 100},
+        [], [], id="empty-content-default-min-length"),
+    pytest.param(
+        InvalidConfigError, ("api.model", "Invalid model name"),
+        {"field": "api.model", "reason": "Invalid model name"},
+        ["api.model", "Invalid model name"], [], id="invalid-config"),
+    pytest.param(
+        MissingConfigError, ("api_key",), {"field": "api_key"},
+        ["api_key"], ["missing"], id="missing-config"),
+    pytest.param(
+        APIKeyNotFoundError, ("Claude",), {"provider": "Claude"},
+        ["Claude"], ["api key"], id="api-key-not-found"),
+    pytest.param(
+        SourceNotFoundError, ("source_123",), {"source_id": "source_123"},
+        ["source_123"], [], id="source-not-found"),
+    pytest.param(
+        DuplicateSourceError, ("source_123",), {"source_id": "source_123"},
+        [], ["already exists"], id="duplicate-source"),
+    pytest.param(
+        OutlineError, ("Invalid section structure",), {},
+        ["Invalid section structure"], [], id="outline"),
+    pytest.param(
+        DraftError, ("introduction", "AI generation failed"),
+        {"section_id": "introduction", "reason": "AI generation failed"},
+        ["introduction"], [], id="draft"),
+    pytest.param(
+        RevisionError, ("methods", "Revision limit exceeded"),
+        {"section_id": "methods", "reason": "Revision limit exceeded"},
+        [], [], id="revision"),
+    pytest.param(
+        FormattingError, ("latex", "Missing template"),
+        {"format_type": "latex", "reason": "Missing template"},
+        ["latex"], [], id="formatting"),
+    pytest.param(
+        InvalidCitationError, ("[Smith 2024]", "Missing author info"),
+        {"citation": "[Smith 2024]", "reason": "Missing author info"},
+        [], [], id="invalid-citation"),
+    pytest.param(
+        CitationNotFoundError, ("smith2024",), {"citation_key": "smith2024"},
+        ["smith2024"], [], id="citation-not-found"),
+    pytest.param(
+        InvalidInputError, ("topic", "", "Cannot be empty"),
+        {"field": "topic", "value": "", "reason": "Cannot be empty"},
+        [], [], id="invalid-input"),
+    pytest.param(
+        FileValidationError, ("/path/to/file.pdf", "File too large"),
+        {"file_path": "/path/to/file.pdf", "reason": "File too large"},
+        [], [], id="file-validation"),
+    pytest.param(
+        PaperSearchError, ("machine learning", "Network timeout"),
+        {"query": "machine learning", "reason": "Network timeout"},
+        [], [], id="paper-search"),
+    pytest.param(
+        PaperNotFoundError, ("arxiv:2024.12345",), {"paper_id": "arxiv:2024.12345"},
+        ["arxiv:2024.12345"], [], id="paper-not-found"),
+]
+
+
 class TestExceptionHierarchy:
     """Test exception hierarchy and inheritance."""
 
@@ -40,183 +156,51 @@ class TestExceptionHierarchy:
         assert "Claude" in str(exc)
 
 
-class TestProjectExceptions:
-    """Test project-related exceptions."""
-
-    def test_project_not_found_error(self):
-        """Test ProjectNotFoundError."""
-        path = "/path/to/project"
-        exc = ProjectNotFoundError(path)
-
-        assert exc.path == path
-        assert path in str(exc)
-        assert "project" in str(exc).lower()
-        assert "found" in str(exc).lower()
-
-    def test_project_already_exists_error(self):
-        """Test ProjectAlreadyExistsError."""
-        path = "/existing/project"
-        exc = ProjectAlreadyExistsError(path)
-
-        assert exc.path == path
-        assert path in str(exc)
-        assert "already exists" in str(exc).lower()
-
-    def test_project_state_error(self):
-        """Test ProjectStateError."""
-        message = "State file corrupted"
-        exc = ProjectStateError(message)
-
-        assert message in str(exc)
-
-
-class TestAPIExceptions:
-    """Test API-related exceptions."""
-
-    def test_api_authentication_error(self):
-        """Test APIAuthenticationError."""
-        provider = "Claude"
-        exc = APIAuthenticationError(provider)
-
-        assert exc.provider == provider
-        assert provider in str(exc)
-        assert "authentication" in str(exc).lower()
-        assert "api key" in str(exc).lower()
-
-    def test_api_rate_limit_error(self):
-        """Test APIRateLimitError."""
-        provider = "Claude"
-        retry_after = 60
-        exc = APIRateLimitError(provider, retry_after)
-
-        assert exc.provider == provider
-        assert exc.retry_after == retry_after
-        assert provider in str(exc)
-        assert "60" in str(exc)
-
-    def test_api_rate_limit_error_without_retry(self):
-        """Test APIRateLimitError without retry_after."""
-        exc = APIRateLimitError("Claude")
-        assert exc.retry_after is None
-        assert "rate limit" in str(exc).lower()
-
-    def test_api_connection_error(self):
-        """Test APIConnectionError."""
-        provider = "Claude"
-        message = "Connection timeout"
-        exc = APIConnectionError(provider, message)
-
-        assert exc.provider == provider
-        assert provider in str(exc)
-        assert message in str(exc)
-
-    def test_api_timeout_error(self):
-        """Test APITimeoutError."""
-        provider = "Claude"
-        timeout = 30
-        exc = APITimeoutError(provider, timeout)
-
-        assert exc.provider == provider
-        assert exc.timeout == timeout
-        assert str(timeout) in str(exc)
-
-
-class TestExtractionExceptions:
-    """Test extraction-related exceptions."""
-
-    def test_pdf_extraction_error(self):
-        """Test PDFExtractionError."""
-        file_path = "/path/to/paper.pdf"
-        reason = "File is corrupted"
-        exc = PDFExtractionError(file_path, reason)
-
-        assert exc.file_path == file_path
-        assert exc.reason == reason
-        assert file_path in str(exc)
-        assert reason in str(exc)
-
-    def test_web_extraction_error(self):
-        """Test WebExtractionError."""
-        url = "https://example.com/paper"
-        reason = "404 Not Found"
-        exc = WebExtractionError(url, reason)
+class TestExceptionAttributes:
+    """Test exception attributes and messages."""
 
-        assert exc.url == url
-        assert exc.reason == reason
-        assert url in str(exc)
-        assert reason in str(exc)
+    @pytest.mark.parametrize("exc_cls, args, attrs, substrings, lower_substrings", _EXCEPTION_CASES)
+    def test_exception(self, exc_cls, args, attrs, substrings, lower_substrings):
+        """Test the exception keeps its arguments and mentions them in its message."""
+        exc = exc_cls(*args)
 
-    def test_empty_content_error(self):
-        """Test EmptyContentError."""
-        source = "paper.pdf"
-        min_length = 100
-        exc = EmptyContentError(source, min_length)
+        for name, value in attrs.items():
+            assert getattr(exc, name) == value
 
-        assert exc.source == source
-        assert exc.min_length == min_length
-        assert source in str(exc)
-        assert str(min_length) in str(exc)
-
-    def test_empty_content_error_default_min_length(self):
-        """Test EmptyContentError with default min_length."""
-        exc = EmptyContentError("paper.pdf")
-        assert exc.min_length == 100
-
-
-class TestConfigurationExceptions:
-    """Test configuration-related exceptions."""
-
-    def test_invalid_config_error(self):
-        """Test InvalidConfigError."""
-        field = "api.model"
-        reason = "Invalid model name"
-        exc = InvalidConfigError(field, reason)
-
-        assert exc.field == field
-        assert exc.reason == reason
-        assert field in str(exc)
-        assert reason in str(exc)
+        text = str(exc)
+        for substring in substrings:
+            assert substring in text
+        lowered = text.lower()
+        for substring in lower_substrings:
+            assert substring in lowered
 
 
 class TestHTTPStatusMapping:
     """Test HTTP status code to exception mapping."""
 
-    def test_map_401_to_authentication_error(self):
-        """Test 401 maps to APIAuthenticationError."""
-        exc = map_http_status_to_exception(401, "TestAPI", "Unauthorized")
-        assert isinstance(exc, APIAuthenticationError)
-        assert exc.provider == "TestAPI"
-
-    def test_map_403_to_authentication_error(self):
-        """Test 403 maps to APIAuthenticationError."""
-        exc = map_http_status_to_exception(403, "TestAPI", "Forbidden")
-        assert isinstance(exc, APIAuthenticationError)
-
-    def test_map_429_to_rate_limit_error(self):
-        """Test 429 maps to APIRateLimitError."""
-        exc = map_http_status_to_exception(429, "TestAPI", "Too Many Requests")
-        assert isinstance(exc, APIRateLimitError)
+    @pytest.mark.parametrize("status, message, exc_cls", [
+        pytest.param(401, "Unauthorized", APIAuthenticationError, id="401"),
+        pytest.param(403, "Forbidden", APIAuthenticationError, id="403"),
+        pytest.param(429, "Too Many Requests", APIRateLimitError, id="429"),
+        pytest.param(500, "Internal Server Error", APIConnectionError, id="500"),
+        pytest.param(502, "Bad Gateway", APIConnectionError, id="502"),
+        pytest.param(400, "Bad Request", APIResponseError, id="other"),
+    ])
+    def test_map_status(self, status, message, exc_cls):
+        """Test each status code maps to its exception type for the provider."""
+        exc = map_http_status_to_exception(status, "TestAPI", message)
+        assert isinstance(exc, exc_cls)
         assert exc.provider == "TestAPI"
 
-    def test_map_500_to_connection_error(self):
-        """Test 500 maps to APIConnectionError."""
+    def test_map_server_error_message(self):
+        """Test 5xx errors are reported as server errors."""
         exc = map_http_status_to_exception(500, "TestAPI", "Internal Server Error")
-        assert isinstance(exc, APIConnectionError)
         assert "Server error" in str(exc)
 
-    def test_map_502_to_connection_error(self):
-        """Test 502 maps to APIConnectionError."""
-        exc = map_http_status_to_exception(502, "TestAPI", "Bad Gateway")
-        assert isinstance(exc, APIConnectionError)
-
-    def test_map_other_status_to_response_error(self):
-        """Test other status codes map to APIResponseError."""
-        from papergen.core.exceptions import APIResponseError
-
+    def test_map_other_status_keeps_code(self):
+        """Test other status codes keep the status code."""
         exc = map_http_status_to_exception(400, "TestAPI", "Bad Request")
-        assert isinstance(exc, APIResponseError)
         assert exc.status_code == 400
-        assert exc.provider == "TestAPI"
 
 
 class TestExceptionCatching:
@@ -242,172 +226,3 @@ class TestExceptionCatching:
         except APIRateLimitError as e:
             assert e.provider == "Claude"
             assert e.retry_after == 60
-
-
-class TestMissingConfigExceptions:
-    """Test configuration missing exceptions."""
-
-    def test_missing_config_error(self):
-        """Test MissingConfigError."""
-        from papergen.core.exceptions import MissingConfigError
-
-        exc = MissingConfigError("api_key")
-
-        assert exc.field == "api_key"
-        assert "api_key" in str(exc)
-        assert "missing" in str(exc).lower()
-
-    def test_api_key_not_found_error(self):
-        """Test APIKeyNotFoundError."""
-        from papergen.core.exceptions import APIKeyNotFoundError
-
-        exc = APIKeyNotFoundError("Claude")
-
-        assert exc.provider == "Claude"
-        assert "Claude" in str(exc)
-        assert "api key" in str(exc).lower()
-
-
-class TestSourceExceptions:
-    """Test source management exceptions."""
-
-    def test_source_not_found_error(self):
-        """Test SourceNotFoundError."""
-        from papergen.core.exceptions import SourceNotFoundError
-
-        exc = SourceNotFoundError("source_123")
-
-        assert exc.source_id == "source_123"
-        assert "source_123" in str(exc)
-
-    def test_duplicate_source_error(self):
-        """Test DuplicateSourceError."""
-        from papergen.core.exceptions import DuplicateSourceError
-
-        exc = DuplicateSourceError("source_123")
-
-        assert exc.source_id == "source_123"
-        assert "already exists" in str(exc).lower()
-
-
-class TestDocumentExceptions:
-    """Test document generation exceptions."""
-
-    def test_outline_error(self):
-        """Test OutlineError."""
-        from papergen.core.exceptions import OutlineError
-
-        exc = OutlineError("Invalid section structure")
-
-        assert "Invalid section structure" in str(exc)
-
-    def test_draft_error(self):
-        """Test DraftError."""
-        from papergen.core.exceptions import DraftError
-
-        exc = DraftError("introduction", "AI generation failed")
-
-        assert exc.section_id == "introduction"
-        assert exc.reason == "AI generation failed"
-        assert "introduction" in str(exc)
-
-    def test_revision_error(self):
-        """Test RevisionError."""
-        from papergen.core.exceptions import RevisionError
-
-        exc = RevisionError("methods", "Revision limit exceeded")
-
-        assert exc.section_id == "methods"
-        assert exc.reason == "Revision limit exceeded"
-
-    def test_formatting_error(self):
-        """Test FormattingError."""
-        from papergen.core.exceptions import FormattingError
-
-        exc = FormattingError("latex", "Missing template")
-
-        assert exc.format_type == "latex"
-        assert exc.reason == "Missing template"
-        assert "latex" in str(exc)
-
-
-class TestCitationExceptions:
-    """Test citation exceptions."""
-
-    def test_invalid_citation_error(self):
-        """Test InvalidCitationError."""
-        from papergen.core.exceptions import InvalidCitationError
-
-        exc = InvalidCitationError("[Smith 2024]", "Missing author info")
-
-        assert exc.citation == "[Smith 2024]"
-        assert exc.reason == "Missing author info"
-
-    def test_citation_not_found_error(self):
-        """Test CitationNotFoundError."""
-        from papergen.core.exceptions import CitationNotFoundError
-
-        exc = CitationNotFoundError("smith2024")
-
-        assert exc.citation_key == "smith2024"
-        assert "smith2024" in str(exc)
-
-
-class TestValidationExceptions:
-    """Test validation exceptions."""
-
-    def test_invalid_input_error(self):
-        """Test InvalidInputError."""
-        from papergen.core.exceptions import InvalidInputError
-
-        exc = InvalidInputError("topic", "", "Cannot be empty")
-
-        assert exc.field == "topic"
-        assert exc.value == ""
-        assert exc.reason == "Cannot be empty"
-
-    def test_file_validation_error(self):
-        """Test FileValidationError."""
-        from papergen.core.exceptions import FileValidationError
-
-        exc = FileValidationError("/path/to/file.pdf", "File too large")
-
-        assert exc.file_path == "/path/to/file.pdf"
-        assert exc.reason == "File too large"
-
-
-class TestDiscoveryExceptions:
-    """Test research discovery exceptions."""
-
-    def test_paper_search_error(self):
-        """Test PaperSearchError."""
-        from papergen.core.exceptions import PaperSearchError
-
-        exc = PaperSearchError("machine learning", "Network timeout")
-
-        assert exc.query == "machine learning"
-        assert exc.reason == "Network timeout"
-
-    def test_paper_not_found_error(self):
-        """Test PaperNotFoundError."""
-        from papergen.core.exceptions import PaperNotFoundError
-
-        exc = PaperNotFoundError("arxiv:2024.12345")
-
-        assert exc.paper_id == "arxiv:2024.12345"
-        assert "arxiv:2024.12345" in str(exc)
-
-
-class TestAPIResponseError:
-    """Test APIResponseError."""
-
-    def test_api_response_error(self):
-        """Test APIResponseError."""
-        from papergen.core.exceptions import APIResponseError
-
-        exc = APIResponseError("Claude", 404, "Not found")
-
-        assert exc.provider == "Claude"
-        assert exc.status_code == 404
-        assert exc.message == "Not found"
-        assert "404" in str(exc)
@@ -1,9 +1,16 @@
 """Tests for InputHandler and CommandCompleter."""
 
 import pytest
+from types import SimpleNamespace as NS
 from unittest.mock import Mock, patch, MagicMock
 from pathlib import Path
-import tempfile
+
+
+@pytest.fixture(scope="module")
+def default_handler():
+    """InputHandler with the default history file, shared by tests that only read it."""
+    from papergen.interactive.input_handler import InputHandler
+    return InputHandler()
 
 
 class TestCommandCompleter:
@@ -23,10 +30,9 @@ class TestCommandCompleter:
         from papergen.interactive.input_handler import CommandCompleter
         completer = CommandCompleter()
 
-        mock_document = Mock()
-        mock_document.text_before_cursor = "/he"
+        document = NS(text_before_cursor="/he")
 
-        completions = list(completer.get_completions(mock_document, None))
+        completions = list(completer.get_completions(document, None))
 
         # Should match /help and /history
         completion_texts = [c.text for c in completions]
@@ -37,10 +43,9 @@ class TestCommandCompleter:
         from papergen.interactive.input_handler import CommandCompleter
         completer = CommandCompleter()
 
-        mock_document = Mock()
-        mock_document.text_before_cursor = "help"
+        document = NS(text_before_cursor="help")
 
-        completions = list(completer.get_completions(mock_document, None))
+        completions = list(completer.get_completions(document, None))
 
         assert len(completions) == 0
 
@@ -49,10 +54,9 @@ class TestCommandCompleter:
         from papergen.interactive.input_handler import CommandCompleter
         completer = CommandCompleter()
 
-        mock_document = Mock()
-        mock_document.text_before_cursor = "/help"
+        document = NS(text_before_cursor="/help")
 
-        completions = list(completer.get_completions(mock_document, None))
+        completions = list(completer.get_completions(document, None))
 
         # Should still match /help
         assert len(completions) >= 1
@@ -61,35 +65,28 @@ class TestCommandCompleter:
 class TestInputHandlerInit:
     """Tests for InputHandler initialization."""
 
-    def test_init_default_history(self):
+    def test_init_default_history(self, default_handler):
         """Test init with default history file."""
-        from papergen.interactive.input_handler import InputHandler
-        handler = InputHandler()
-
-        assert handler.history_file is not None
-        assert ".papergen" in str(handler.history_file)
-        assert handler.session is None
+        assert default_handler.history_file is not None
+        assert ".papergen" in str(default_handler.history_file)
+        assert default_handler.session is None
 
-    def test_init_custom_history(self):
+    def test_init_custom_history(self, tmp_path):
         """Test init with custom history file."""
         from papergen.interactive.input_handler import InputHandler
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            history_file = Path(tmpdir) / "custom_history"
-            handler = InputHandler(history_file=history_file)
+        history_file = tmp_path / "custom_history"
+        handler = InputHandler(history_file=history_file)
 
-            assert handler.history_file == history_file
+        assert handler.history_file == history_file
 
 
 class TestInputHandlerDefaultHistory:
     """Tests for _get_default_history method."""
 
-    def test_get_default_history(self):
+    def test_get_default_history(self, default_handler):
         """Test getting default history path."""
-        from papergen.interactive.input_handler import InputHandler
-        handler = InputHandler()
-
-        result = handler._get_default_history()
+        result = default_handler._get_default_history()
 
         assert isinstance(result, Path)
         assert "papergen" in str(result)
@@ -99,56 +96,53 @@ class TestInputHandlerDefaultHistory:
 class TestInputHandlerInitialize:
     """Tests for initialize method."""
 
-    def test_initialize_creates_session(self):
+    def test_initialize_creates_session(self, tmp_path):
         """Test initialize creates prompt session."""
         from papergen.interactive.input_handler import InputHandler
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            history_file = Path(tmpdir) / "history"
-            handler = InputHandler(history_file=history_file)
+        history_file = tmp_path / "history"
+        handler = InputHandler(history_file=history_file)
 
-            handler.initialize()
+        handler.initialize()
 
-            assert handler.session is not None
+        assert handler.session is not None
 
 
 class TestInputHandlerPrompt:
     """Tests for prompt method."""
 
-    def test_prompt_initializes_if_needed(self):
+    def test_prompt_initializes_if_needed(self, tmp_path):
         """Test prompt initializes session if needed."""
         from papergen.interactive.input_handler import InputHandler
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            history_file = Path(tmpdir) / "history"
-            handler = InputHandler(history_file=history_file)
+        history_file = tmp_path / "history"
+        handler = InputHandler(history_file=history_file)
 
-            assert handler.session is None
+        assert handler.session is None
 
-            # Mock the session to avoid actual prompt
-            mock_session = Mock()
-            mock_session.prompt.return_value = "test input"
+        # Mock the session to avoid actual prompt
+        mock_session = Mock()
+        mock_session.prompt.return_value = "test input"
 
-            with patch.object(handler, 'initialize'):
-                handler.session = mock_session
-                result = handler.prompt("Test > ")
+        with patch.object(handler, 'initialize'):
+            handler.session = mock_session
+            result = handler.prompt("Test > ")
 
-            assert result == "test input"
+        assert result == "test input"
 
-    def test_prompt_multiline(self):
+    def test_prompt_multiline(self, tmp_path):
         """Test multiline prompt."""
         from papergen.interactive.input_handler import InputHandler
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            history_file = Path(tmpdir) / "history"
-            handler = InputHandler(history_file=history_file)
+        history_file = tmp_path / "history"
+        handler = InputHandler(history_file=history_file)
 
-            mock_session = Mock()
-            mock_session.prompt.return_value = "line 1\nline 2"
+        mock_session = Mock()
+        mock_session.prompt.return_value = "line 1\nline 2"
 
-            with patch.object(handler, 'initialize'):
-                handler.session = mock_session
-                result = handler.prompt_multiline("Test > ")
+        with patch.object(handler, 'initialize'):
+            handler.session = mock_session
+            result = handler.prompt_multiline("Test > ")
 
-            assert result == "line 1\nline 2"
-            mock_session.prompt.assert_called_with("Test > ", multiline=True)
+        assert result == "line 1\nline 2"
+        mock_session.prompt.assert_called_with("Test > ", multiline=True)